@@ -4,11 +4,133 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
+import os
+
 import mozwebqa
+import pytest
+
+from pages.browser_pool import BrowserPool
+from pages.desktop.addons_api import AddOnsAPI
+from pages.desktop.addons_site import ViewReviews
+from pages.desktop.details import Details
+from pages.driver import Driver
+from pages.duration_history import DurationHistory
+from pages.profiler import CommandProfiler
+from pages.shared_pages import SharedPages
+from pages.http_client import Cassette, HttpClient, RecordingClient, ReplayClient
+from pages.http_driver import HttpDriver
+from tests.fake_amo_api import FakeAMOAPIServer
+
+
+def pytest_configure(config):
+    if config.option.api_replay:
+        AddOnsAPI.http_client = ReplayClient(Cassette(config.option.api_replay))
+    elif config.option.api_record:
+        AddOnsAPI.http_client = RecordingClient(Cassette(config.option.api_record),
+                                                cache_dir=config.option.api_cache_dir)
+    else:
+        AddOnsAPI.http_client = HttpClient(cache_dir=config.option.api_cache_dir)
+    config.command_profiler = None
+    if config.option.command_profile:
+        config.command_profiler = CommandProfiler()
+    if hasattr(config, 'slaveinput'):
+        # workers order their tests by the history the master read
+        config.duration_history = DurationHistory(config.option.duration_history,
+                                                  config.slaveinput.get('test_durations', {}))
+    else:
+        config.duration_history = DurationHistory(config.option.duration_history)
+    config.browser_pool = None
+    if config.option.pool_browsers:
+        config.browser_pool = BrowserPool(config.option.base_url)
+    # for pages read without a browser
+    config.page_http_client = HttpClient(headers=HttpDriver.headers)
+    ViewReviews.http_client = config.page_http_client
+
+
+def pytest_unconfigure(config):
+    AddOnsAPI.http_client.close()
+    if config.browser_pool:
+        config.browser_pool.close()
+    config.page_http_client.close()
+
+
+def pytest_configure_node(node):
+    if node.config.option.dist == 'load':
+        node.slaveinput['test_durations'] = node.config.duration_history.durations
+
+
+def pytest_collection_modifyitems(session, config, items):
+    # every worker has to come up with the same order
+    if hasattr(config, 'slaveinput') and 'test_durations' in config.slaveinput:
+        config.duration_history.longest_first(items)
 
 
 def pytest_runtest_setup(item):
     mozwebqa.TestSetup.api_base_url = item.config.option.api_base_url
+    if item.config.command_profiler:
+        item.config.command_profiler.current_test = '::'.join(item.listnames()[1:])
+    if 'benchmark' in item.keywords and not item.config.option.benchmark:
+        pytest.skip('benchmarks only run with --benchmark')
+    item.reads_over_http = _reads_over_http(item)
+    if item.reads_over_http:
+        # the funcarg hands out an HttpDriver instead of a browser
+        item.keywords['skip_selenium'] = True
+    item.pooled_browser = None
+    if _uses_browser_pool(item):
+        item.pooled_browser = item.config.browser_pool.acquire()
+        if item.pooled_browser is not None:
+            # keeps the plugin from starting a browser, the funcarg hands
+            # out the pooled one instead
+            item.keywords['skip_selenium'] = True
+
+
+def pytest_runtest_logreport(report):
+    # the master sees the reports of every worker
+    config = pytest.config
+    if not hasattr(config, 'slaveinput'):
+        config.duration_history.add(report.nodeid, report.duration)
+
+
+def pytest_runtest_makereport(__multicall__, item, call):
+    report = __multicall__.execute()
+    # an expected failure is reported as skipped, but leaves the browser
+    # in as unknown a state as any other
+    if report.failed or (call.excinfo is not None and 'xfail' in report.keywords):
+        item.browser_failed = True
+    return report
+
+
+def pytest_runtest_teardown(item):
+    if not _uses_browser_pool(item):
+        return
+    selenium = item.pooled_browser or getattr(mozwebqa.TestSetup, 'selenium', None)
+    if selenium is None:
+        return
+    if getattr(item, 'browser_failed', False):
+        if item.pooled_browser is not None:
+            # let the plugin capture the debug information and quit it
+            del item.keywords['skip_selenium']
+            mozwebqa.TestSetup.selenium = selenium
+        return
+    item.config.browser_pool.release(selenium, mozwebqa.TestSetup.default_implicit_wait)
+    # the plugin quits the browser it finds here
+    mozwebqa.TestSetup.selenium = None
+
+
+def _reads_over_http(item):
+    # tests that click, type, hover, check visibility or log in are marked
+    # with @pytest.mark.browser one by one, all other reads go over http
+    return (item.config.option.page_backend == 'http' and
+            'nondestructive' in item.keywords and
+            not [name for name in ('destructive', 'browser', 'native', 'skip_selenium') if name in item.keywords])
+
+
+def _uses_browser_pool(item):
+    # destructive tests and tests without a browser never share one
+    return (item.config.browser_pool is not None and
+            'nondestructive' in item.keywords and
+            'destructive' not in item.keywords and
+            ('skip_selenium' not in item.keywords or getattr(item, 'pooled_browser', None) is not None))
 
 
 def pytest_addoption(parser):
@@ -18,7 +140,163 @@ def pytest_addoption(parser):
                      metavar='str',
                      default="https://addons-dev.allizom.org",
                      help="specify the api url")
+    parser.addoption("--apicachedir",
+                     action="store",
+                     dest='api_cache_dir',
+                     metavar='path',
+                     default=None,
+                     help="keep api responses in this directory and revalidate them on later runs")
+    parser.addoption("--api-record",
+                     action="store",
+                     dest='api_record',
+                     metavar='path',
+                     default=None,
+                     help="record every api response into this cassette file")
+    parser.addoption("--api-replay",
+                     action="store",
+                     dest='api_replay',
+                     metavar='path',
+                     default=None,
+                     help="serve api responses from this cassette file instead of the network, "
+                          "--baseurl is still checked and has to answer with 200")
+    parser.addoption("--benchmark",
+                     action="store_true",
+                     dest='benchmark',
+                     default=False,
+                     help="run the benchmarks")
+    parser.addoption("--benchmark-baseline",
+                     action="store",
+                     dest='benchmark_baseline',
+                     metavar='path',
+                     default=os.path.join(os.path.dirname(__file__), 'tests', 'benchmarks', 'baseline.json'),
+                     help="json file of benchmark results to compare with")
+    parser.addoption("--benchmark-save",
+                     action="store_true",
+                     dest='benchmark_save',
+                     default=False,
+                     help="store the benchmark results as the new baseline")
+    parser.addoption("--benchmark-threshold",
+                     action="store",
+                     dest='benchmark_threshold',
+                     type='float',
+                     metavar='fraction',
+                     default=0.25,
+                     help="fail benchmarks that are worse than the baseline by more than this fraction")
+    parser.addoption("--command-profile",
+                     action="store",
+                     dest='command_profile',
+                     metavar='path',
+                     default=None,
+                     help="count and time every webdriver command and write the profile to this json file")
+    parser.addoption("--command-profile-top",
+                     action="store",
+                     dest='command_profile_top',
+                     type='int',
+                     metavar='num',
+                     default=10,
+                     help="number of methods and tests shown in the webdriver command report")
+    parser.addoption("--pool-browsers",
+                     action="store_true",
+                     dest='pool_browsers',
+                     default=False,
+                     help="reuse the browser of a passed nondestructive test for the next one")
+    parser.addoption("--duration-history",
+                     action="store",
+                     dest='duration_history',
+                     metavar='path',
+                     default=os.path.join(os.path.dirname(__file__), '.test_durations.json'),
+                     help="json file of test durations used to run the longest tests first with -n")
+    parser.addoption("--page-backend",
+                     action="store",
+                     dest='page_backend',
+                     type='choice',
+                     choices=['webdriver', 'http'],
+                     default='webdriver',
+                     help="with 'http', nondestructive tests that are not marked browser or native "
+                          "read server rendered pages without a browser")
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if not hasattr(config, 'slaveinput'):
+        config.duration_history.save()
+    if config.command_profiler and hasattr(config, 'slaveoutput'):
+        # hand the profile of an xdist worker to the master
+        config.slaveoutput['command_profile'] = config.command_profiler.as_dict()
+
+
+def pytest_testnodedown(node, error):
+    profile = getattr(node, 'slaveoutput', {}).get('command_profile')
+    if node.config.command_profiler and profile:
+        node.config.command_profiler.merge(profile)
+
+
+def pytest_terminal_summary(terminalreporter):
+    config = terminalreporter.config
+    profiler = config.command_profiler
+    if not profiler or hasattr(config, 'slaveinput'):
+        return
+    terminalreporter.write_sep('-', 'webdriver command profile')
+    for line in profiler.report(config.option.command_profile_top):
+        terminalreporter.write_line(line)
+    profiler.save(config.option.command_profile)
+    terminalreporter.write_line('profile written to %s' % config.option.command_profile)
 
 
 def pytest_funcarg__mozwebqa(request):
-    return mozwebqa.TestSetup(request)
+    pooled_browser = getattr(request._pyfuncitem, 'pooled_browser', None)
+    if pooled_browser is not None:
+        mozwebqa.TestSetup.selenium = pooled_browser
+    testsetup = mozwebqa.TestSetup(request)
+    if getattr(request._pyfuncitem, 'reads_over_http', False):
+        testsetup.selenium = HttpDriver(request.config.page_http_client)
+    elif getattr(testsetup, 'selenium', None) is not None:
+        if request.config.command_profiler:
+            request.config.command_profiler.instrument(testsetup.selenium)
+        # the plugin sets default_implicit_wait on the browser before each test
+        testsetup.selenium = Driver(testsetup.selenium, testsetup.default_implicit_wait)
+    return testsetup
+
+
+def pytest_funcarg__shared_details(request):
+    """
+    Opens details pages like Details(mozwebqa, addon_name), but the tests of
+    a module share one copy of each page for as long as none of them
+    touches it. Reuse needs a browser that outlives the test, so without
+    --pool-browsers every test loads its page as usual.
+
+    Clicks, typing, hovering, focus, scrolling and navigation mark a page as
+    touched, but changes made with execute_script go unnoticed. Tests that
+    change the page that way must use Details(mozwebqa, addon_name).
+
+        details_page = shared_details('Firebug')
+    """
+    mozwebqa = request.getfuncargvalue('mozwebqa')
+    if not _uses_browser_pool(request._pyfuncitem):
+        return lambda addon_name: Details(mozwebqa, addon_name)
+    shared_pages = request.cached_setup(setup=SharedPages, scope='module')
+    return lambda addon_name: Details(mozwebqa, addon_name, shared_pages)
+
+
+def pytest_funcarg__amo_api_server(request):
+    """
+    A local stand-in for the AMO search API, started once per session.
+    Point a test at it with mozwebqa.api_base_url = amo_api_server.url.
+    """
+    server = request.cached_setup(setup=lambda: FakeAMOAPIServer().start(),
+                                  teardown=lambda server: server.stop(),
+                                  scope='session')
+    server.reset()
+    # cached documents of the previous test may come from a different catalog
+    AddOnsAPI.cache.clear()
+    # the fake server listens on a new port every run, so its responses
+    # must neither be replayed from nor recorded into a cassette
+    http_client = AddOnsAPI.http_client
+    AddOnsAPI.http_client = HttpClient()
+
+    def restore_http_client():
+        AddOnsAPI.http_client.close()
+        AddOnsAPI.http_client = http_client
+        AddOnsAPI.cache.clear()
+    request.addfinalizer(restore_http_client)
+    return server
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import urlparse
+
+# Empties the web storage of the page the browser is on. Pages like
+# about:blank have none and throw when it is touched.
+_CLEAR_STORAGE_SCRIPT = """
+try {
+    window.localStorage.clear();
+    window.sessionStorage.clear();
+} catch (e) {
+}
+"""
+
+
+class BrowserPool(object):
+    """
+    Keeps the browsers of passed tests running for the next tests.
+
+    A browser goes back into the pool with reset, which closes every window
+    but the first and clears the cookies and web storage of the site under
+    test. Cookies that other sites set in the browser, like those of the
+    BrowserID server, are not reachable from there and survive.
+    """
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self._idle = []
+
+    def acquire(self):
+        """Returns an idle browser, or None if a new one has to be started."""
+        if self._idle:
+            return self._idle.pop()
+        return None
+
+    def release(self, selenium, implicit_wait):
+        """
+        Resets a browser and puts it back in the pool. A browser that
+        cannot be reset is quit instead.
+        """
+        try:
+            self.reset(selenium, implicit_wait)
+        except Exception:
+            self.discard(selenium)
+            return
+        self._idle.append(selenium)
+
+    def reset(self, selenium, implicit_wait):
+        handles = selenium.window_handles
+        for handle in handles[1:]:
+            selenium.switch_to_window(handle)
+            selenium.close()
+        selenium.switch_to_window(handles[0])
+        if urlparse.urlparse(selenium.current_url)[1] != urlparse.urlparse(self.base_url)[1]:
+            # cookies and storage can only be cleared for the current site
+            selenium.get(self.base_url)
+        selenium.delete_all_cookies()
+        selenium.execute_script(_CLEAR_STORAGE_SCRIPT)
+        selenium.implicitly_wait(implicit_wait)
+
+    def discard(self, selenium):
+        try:
+            selenium.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        while self._idle:
+            self.discard(self._idle.pop())
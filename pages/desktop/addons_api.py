@@ -4,67 +4,358 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
+import Queue
 import re
-import urllib2
+import threading
+import time
 
-from BeautifulSoup import BeautifulStoneSoup
+from StringIO import StringIO
+from xml.etree.cElementTree import iterparse
+from xml.sax.saxutils import escape
 
 from pages.desktop.base import Base
+from pages.http_client import HttpClient
+from pages.prefetch import prefetch_pages
+
+
+class SearchCache(object):
+    """
+    Process-wide cache of parsed API search documents.
+
+    Entries are keyed by (api_base_url, search term), expire after `ttl`
+    seconds and the least recently used entry is evicted once more than
+    `max_entries` documents are held. Concurrent requests for the same key
+    wait for the first one to finish loading, so every document is fetched
+    and parsed once per process. pytest-xdist workers are separate processes
+    and each keeps its own cache.
+    """
+
+    def __init__(self, max_entries=64, ttl=3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = {}
+        self._loading = {}
+        self._lock = threading.Lock()
+        self._clock = 0
+
+    def get(self, key, load):
+        """Returns the cached value for key, calling load() to create it on a miss."""
+        while True:
+            self._lock.acquire()
+            try:
+                entry = self._entries.get(key)
+                if entry is not None and time.time() - entry['created'] <= self.ttl:
+                    self._clock += 1
+                    entry['used'] = self._clock
+                    return entry['value']
+                loading = self._loading.get(key)
+                if loading is None:
+                    loading = self._loading[key] = threading.Event()
+                    break
+            finally:
+                self._lock.release()
+            # another thread is loading this key, wait for it and look again
+            loading.wait()
+
+        try:
+            value = load()
+            self._lock.acquire()
+            try:
+                self._clock += 1
+                self._entries[key] = {'value': value, 'created': time.time(), 'used': self._clock}
+                self._evict()
+            finally:
+                self._lock.release()
+            return value
+        finally:
+            self._lock.acquire()
+            try:
+                del self._loading[key]
+            finally:
+                self._lock.release()
+            loading.set()
+
+    def clear(self):
+        self._lock.acquire()
+        try:
+            self._entries.clear()
+        finally:
+            self._lock.release()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _evict(self):
+        now = time.time()
+        for key in [k for k, entry in self._entries.items() if now - entry['created'] > self.ttl]:
+            del self._entries[key]
+        while len(self._entries) > self.max_entries:
+            oldest = min(self._entries, key=lambda k: self._entries[k]['used'])
+            del self._entries[oldest]
+
+
+class AddonRecord(object):
+    """
+    The fields of one <addon> element of an API search document.
+
+    Text values keep their markup escaped (&lt;a&gt; rather than <a>), the
+    way the search document delivers them.
+    """
+
+    __slots__ = ('name', 'slug', 'guid', 'type_id', 'type_name', 'status_id', 'status_name',
+                 'version', 'authors', 'summary', 'description', 'icon', 'thumbnails',
+                 'support', 'learnmore', 'rating', 'compatible_application', 'total_downloads',
+                 'developer_comments', 'homepage', 'reviews_count', 'daily_users', 'install')
+
+    # child elements whose text is stored as is, under the same name
+    _text_fields = ('name', 'slug', 'guid', 'version', 'summary', 'description', 'icon',
+                    'support', 'learnmore', 'rating', 'total_downloads', 'developer_comments',
+                    'homepage', 'daily_users', 'install')
+
+    def __init__(self, addon_element):
+        for field in self.__slots__:
+            setattr(self, field, None)
+        self.authors = []
+        self.thumbnails = []
+
+        for child in addon_element:
+            tag = child.tag
+            if tag in self._text_fields:
+                # the first occurrence wins, e.g. the 32px <icon>
+                if getattr(self, tag) is None:
+                    setattr(self, tag, _element_text(child))
+            elif tag == 'type':
+                self.type_id = child.get('id')
+                self.type_name = _element_text(child)
+            elif tag == 'status':
+                self.status_id = child.get('id')
+                self.status_name = _element_text(child)
+            elif tag == 'authors':
+                self.authors = [_element_text(name) for name in child.getiterator('name')]
+            elif tag == 'previews':
+                self.thumbnails = [_element_text(thumbnail) for thumbnail in child.getiterator('thumbnail')]
+            elif tag == 'compatible_applications':
+                application = child.find('application')
+                if application is not None:
+                    self.compatible_application = (_element_text(application.find('name')),
+                                                   _element_text(application.find('min_version')),
+                                                   _element_text(application.find('max_version')))
+            elif tag == 'reviews':
+                self.reviews_count = child.get('num')
+
+    def __repr__(self):
+        return '<AddonRecord %r>' % self.name
+
+
+def _element_text(element):
+    if element is None or not element.text:
+        return None
+    return escape(element.text)
+
+
+def iter_addon_records(source):
+    """
+    Parses an API search document incrementally from the file-like source
+    and yields an AddonRecord for every <addon> element. Each element is
+    dropped from the tree as soon as its record is built, so memory use
+    does not grow with the size of the document.
+    """
+    root = None
+    depth = 0
+    for event, element in iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = element
+            elif element.tag == 'addon':
+                depth += 1
+        elif element.tag == 'addon':
+            depth -= 1
+            if depth == 0:
+                yield AddonRecord(element)
+                root.clear()
 
 
 class AddOnsAPI(Base):
 
+    # shared by every instance so that each search document is only fetched once
+    cache = SearchCache()
+    # replaced by conftest.py with a client using the --apicachedir disk cache
+    http_client = HttpClient()
+
+    # number of searches prefetch() runs at the same time
+    prefetch_concurrency = 8
+
     def __init__(self, testsetup, search_extension='firebug'):
         Base.__init__(self, testsetup)
-        self.search_url = '%s/en-us/firefox/api/1.5/search/%s' % (testsetup.api_base_url, search_extension)
-        self.parsed_xml = BeautifulStoneSoup(urllib2.urlopen(self.search_url))
+        self.search_url = self._search_url(testsetup.api_base_url, search_extension)
+        self.addons, self.addons_by_name = self._cached_search(testsetup.api_base_url, search_extension)
+
+    @classmethod
+    def prefetch(cls, testsetup, search_terms, concurrency=None):
+        """
+        Fetches and parses the search documents of all search_terms into the
+        shared cache, running up to `concurrency` searches at the same time,
+        so that AddOnsAPI instances created for them later need no request.
+
+        Returns a dictionary of the search terms that failed and their errors.
+        """
+        pending = Queue.Queue()
+        for search_term in search_terms:
+            pending.put(search_term)
+        failures = {}
+
+        def work():
+            while True:
+                try:
+                    search_term = pending.get_nowait()
+                except Queue.Empty:
+                    return
+                try:
+                    cls._cached_search(testsetup.api_base_url, search_term)
+                except Exception, e:
+                    failures[search_term] = e
+
+        workers = [threading.Thread(target=work)
+                   for i in range(min(concurrency or cls.prefetch_concurrency, pending.qsize()))]
+        for worker in workers:
+            worker.daemon = True
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return failures
+
+    @classmethod
+    def iter_addons(cls, testsetup, search_extension, page_size=100, max_pages=2):
+        """
+        Yields an AddonRecord for every result of a search, page by page.
+
+        The next page is fetched in the background while the current one is
+        consumed and at most max_pages pages are fetched ahead of it, so
+        whole catalogs can be checked without loading them at once. Pages are not
+        kept in the search cache.
+        """
+        search_url = '%s/all/%d' % (cls._search_url(testsetup.api_base_url, search_extension), page_size)
+        def fetch_page(page_number):
+            body = cls.http_client.get('%s?page=%d' % (search_url, page_number))
+            addons = list(iter_addon_records(StringIO(body)))
+            return addons, len(addons) >= page_size
+
+        return prefetch_pages(fetch_page, max_pages, key=lambda addon: addon.slug)
+
+    @classmethod
+    def _search_url(cls, api_base_url, search_extension):
+        return '%s/en-us/firefox/api/1.5/search/%s' % (api_base_url, search_extension)
+
+    @classmethod
+    def _cached_search(cls, api_base_url, search_extension):
+        search_url = cls._search_url(api_base_url, search_extension)
+        return cls.cache.get((api_base_url, search_extension), lambda: cls._load(search_url))
+
+    @classmethod
+    def _load(cls, search_url):
+        addons = list(iter_addon_records(StringIO(cls.http_client.get(search_url))))
+        return addons, cls._index_addons(addons)
+
+    @classmethod
+    def _index_addons(cls, addons):
+        """
+        Maps the normalized name and slug of every addon to its record.
+        The first addon wins when two share a key, as a text search of the
+        document would have returned.
+        """
+        index = {}
+        for addon in addons:
+            for key in (addon.name, addon.slug):
+                if key:
+                    index.setdefault(cls._normalize_name(key), addon)
+        return index
+
+    @staticmethod
+    def _normalize_name(addon_name):
+        return ' '.join(addon_name.split()).lower()
 
     def get_xml_for_single_addon(self, addon_name):
+        """Returns the AddonRecord of the named addon."""
         try:
-            addon_xml = self.parsed_xml.find(text=addon_name).findParent().findParent()
-            return addon_xml
-        except AttributeError:
+            return self.addons_by_name[self._normalize_name(addon_name)]
+        except KeyError:
             self._print_search_error()
 
     def get_name_of_first_addon(self):
         try:
-            name_of_first_addon_listed = self.parsed_xml.searchresults.addon.nameTag.contents[0]
-            return name_of_first_addon_listed
-        except:
+            return self.addons[0].name
+        except IndexError:
             print 'Check that searchresults returned valid xml'
 
+    def get_addon_record(self, addon_name):
+        """
+        Returns every field the get_* methods expose for the named addon as
+        a dictionary, read from its record in one pass, or None when the
+        addon is not in the search results.
+        """
+        addon = self.get_xml_for_single_addon(addon_name)
+        if addon is None:
+            return None
+        return {
+            'name': addon.name,
+            'type': (addon.type_id, addon.type_name),
+            'status': (addon.status_id, addon.status_name),
+            'version': addon.version,
+            'summary': addon.summary and self._strip_links_from_text(addon.summary),
+            'description': addon.description and self._strip_links_from_text(addon.description),
+            'authors': list(addon.authors),
+            'previews': [thumbnail.strip('\n ') for thumbnail in addon.thumbnails],
+            'icon': addon.icon,
+            'support': addon.support,
+            'learnmore': addon.learnmore,
+            'rating': addon.rating,
+            'compatibility': addon.compatible_application,
+            'downloads': self._to_int(addon.total_downloads),
+            'developer_comments': addon.developer_comments and
+                self._strip_links_from_text(addon.developer_comments.rstrip("\n")),
+            'homepage': addon.homepage,
+            'reviews': self._to_int(addon.reviews_count),
+            'daily_users': self._to_int(addon.daily_users),
+            'install': addon.install,
+        }
+
+    def _to_int(self, value):
+        if value is None:
+            return None
+        return int(value)
+
     def get_addon_type_name(self, addon_name):
         try:
             addon_xml = self.get_xml_for_single_addon(addon_name)
-            return addon_xml.type.string
+            return addon_xml.type_name
         except:
             self._print_search_error()
 
     def get_addon_type_id(self, addon_name):
         try:
             addon_xml = self.get_xml_for_single_addon(addon_name)
-            return addon_xml.type["id"]
+            return addon_xml.type_id
         except AttributeError:
             self._print_search_error()
 
     def get_addon_status(self, addon_name):
         try:
             addon_xml = self.get_xml_for_single_addon(addon_name)
-            return addon_xml.status['id'], addon_xml.status.string
+            return addon_xml.status_id, addon_xml.status_name
         except AttributeError:
             self._print_search_error()
 
     def get_addon_version_number(self, addon_name):
         try:
             addon_xml = self.get_xml_for_single_addon(addon_name)
-            return addon_xml.version.string
+            return addon_xml.version
         except AttributeError:
             self._print_search_error()
 
     def get_addon_description(self, addon_name):
         try:
             addon_xml = self.get_xml_for_single_addon(addon_name)
-            description = addon_xml.description.string
+            description = addon_xml.description
             return self._strip_links_from_text(description)
         except AttributeError:
             self._print_search_error()
@@ -72,7 +363,7 @@ class AddOnsAPI(Base):
     def get_addon_summary(self, addon_name):
         try:
             addon_xml = self.get_xml_for_single_addon(addon_name)
-            summary = addon_xml.summary.string
+            summary = addon_xml.summary
             return self._strip_links_from_text(summary)
         except AttributeError:
             self._print_search_error()
@@ -80,72 +371,64 @@ class AddOnsAPI(Base):
     def get_list_of_addon_author_names(self, addon_name):
         try:
             addon_xml = self.get_xml_for_single_addon(addon_name)
-            name_tags = addon_xml.authors.findAll('name')
-
-            return [BeautifulStoneSoup(str(name_tags[i])).find('name').string
-                for i in range(len(name_tags))]
-
+            return list(addon_xml.authors)
         except AttributeError:
             self._print_search_error()
 
     def get_list_of_addon_images_links(self, addon_name):
         try:
             addon_xml = self.get_xml_for_single_addon(addon_name)
-            name_tags = addon_xml.previews.findAll('thumbnail')
-
-            return [BeautifulStoneSoup(str(name_tags[i])).find('thumbnail').string.strip('\n ')
-                for i in range(len(name_tags))]
-
+            return [thumbnail.strip('\n ') for thumbnail in addon_xml.thumbnails]
         except AttributeError:
             self._print_search_error()
 
     def get_icon_url(self, addon_name):
         try:
             addon_xml = self.get_xml_for_single_addon(addon_name)
-            return addon_xml.icon.string
+            return addon_xml.icon
         except:
             self._print_search_error()
 
     def get_support_url(self, addon_name):
         try:
             addon_xml = self.get_xml_for_single_addon(addon_name)
-            return addon_xml.support.string
+            return addon_xml.support
         except:
             self._print_search_error()
 
     def get_learn_more_url(self, addon_name):
         try:
             addon_xml = self.get_xml_for_single_addon(addon_name)
-            return addon_xml.learnmore.string
+            return addon_xml.learnmore
         except:
             self._print_search_error()
 
     def get_rating(self, addon_name):
         try:
             addon_xml = self.get_xml_for_single_addon(addon_name)
-            return addon_xml.rating.string
+            return addon_xml.rating
         except:
             self._print_search_error()
 
     def get_compatible_applications(self, addon_name):
         try:
             addon_xml = self.get_xml_for_single_addon(addon_name)
-            return (addon_xml.application.find('name').string,
-                    addon_xml.min_version.string, addon_xml.max_version.string)
-        except AttributeError:
+            name, min_version, max_version = addon_xml.compatible_application
+            return name, min_version, max_version
+        except (AttributeError, TypeError):
             self._print_search_error()
 
     def get_total_downloads(self, addon_name):
         try:
             addon_xml = self.get_xml_for_single_addon(addon_name)
-            return int(addon_xml.total_downloads.string)
-        except AttributeError:
+            return int(addon_xml.total_downloads)
+        except (AttributeError, TypeError):
             self._print_search_error()
 
     def get_devs_comments(self, addon_name):
         try:
             addon_xml = self.get_xml_for_single_addon(addon_name)
-            developer_comments = addon_xml.developer_comments.string.rstrip("\n")
+            developer_comments = addon_xml.developer_comments.rstrip("\n")
             return self._strip_links_from_text(developer_comments)
         except AttributeError:
             self._print_search_error()
@@ -153,21 +436,21 @@ class AddOnsAPI(Base):
     def get_home_page(self, addon_name):
         try:
             addon_xml = self.get_xml_for_single_addon(addon_name)
-            return addon_xml.homepage.string
+            return addon_xml.homepage
         except:
             self._print_search_error()
 
     def get_reviews_count(self, addon_name):
         try:
             addon_xml = self.get_xml_for_single_addon(addon_name)
-            return int(addon_xml.reviews['num'])
+            return int(addon_xml.reviews_count)
         except:
             self._print_search_error()
 
     def get_daily_users(self, addon_name):
         try:
             addon_xml = self.get_xml_for_single_addon(addon_name)
-            return int(addon_xml.daily_users.string)
+            return int(addon_xml.daily_users)
         except:
             self._print_search_error()
 
@@ -184,6 +467,6 @@ class AddOnsAPI(Base):
 
     def get_install_link(self, addon_name):
         try:
-            return self.get_xml_for_single_addon(addon_name).install.string
+            return self.get_xml_for_single_addon(addon_name).install
         except:
             self._print_search_error()
@@ -4,11 +4,18 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
+import copy
 import re
+import urllib
+import urlparse
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 
+from pages.http_client import HttpClient
+from pages.http_driver import HttpDriver
+from pages.page import PageRecord
+from pages.prefetch import prefetch_pages
 from pages.desktop.base import Base
 
 
@@ -41,12 +48,87 @@ class WriteReviewBlock(Base):
 class ViewReviews(Base):
 
     _review_locator = (By.CSS_SELECTOR, "div.primary div.review")
+    _next_page_locator = (By.CSS_SELECTOR, 'nav.paginator .rel a.next')
+
+    # the HttpClient review pages are streamed with, set by conftest.py
+    http_client = None
 
     @property
     def reviews(self):
         """Returns review object with index."""
         return [self.ReviewSnippet(self.testsetup, element) for element in self.selenium.find_elements(*self._review_locator)]
 
+    def iter_all_reviews(self, max_pages=2):
+        """Yields the reviews of every page of this listing, see iter_reviews."""
+        return self.iter_reviews(self.testsetup, self.get_url_current_page(), max_pages)
+
+    @classmethod
+    def iter_reviews(cls, testsetup, url, max_pages=2):
+        """
+        Yields a PageRecord with the author, text, rating and date of every
+        review of the listing at url, page by page.
+
+        Pages are downloaded by their url instead of clicking through the
+        paginator in the browser. With a browser, the requests carry its
+        cookies, user agent and language, so logged in and localized
+        listings match what it shows. The next page is fetched and parsed in
+        the background while the current one is consumed, and at most
+        max_pages pages are fetched ahead of it.
+        """
+        http_client = cls._session_client(testsetup.selenium)
+
+        def fetch_page(page_number):
+            page_setup = copy.copy(testsetup)
+            page_setup.selenium = HttpDriver(http_client)
+            page_setup.selenium.get(cls._page_url(url, page_number))
+            reviews_page = cls(page_setup)
+            reviews = [PageRecord({'author': review.author, 'text': review.text,
+                                   'rating': review.rating, 'date': review.date})
+                       for review in reviews_page.reviews]
+            if not reviews:
+                return reviews, False
+            next_link = reviews_page._find_optional_element(cls._next_page_locator)
+            return reviews, next_link is not None and 'disabled' not in next_link.get_attribute('class')
+
+        reviews = prefetch_pages(fetch_page, max_pages, key=lambda review: (review.author, review.text))
+        if http_client is cls.http_client:
+            return reviews
+        return cls._closing(reviews, http_client)
+
+    @classmethod
+    def _session_client(cls, selenium):
+        """
+        Returns an HttpClient that sends the session of the browser behind
+        selenium, or http_client when there is no browser.
+        """
+        if not getattr(selenium, 'runs_javascript', True):
+            return cls.http_client
+        user_agent, language = selenium.execute_read_script(
+            'return [navigator.userAgent, navigator.language];')
+        headers = dict(cls.http_client.headers)
+        headers['User-Agent'] = user_agent
+        headers['Accept-Language'] = language
+        cookies = selenium.get_cookies()
+        if cookies:
+            headers['Cookie'] = '; '.join('%s=%s' % (cookie['name'], cookie['value']) for cookie in cookies)
+        return HttpClient(timeout=cls.http_client.timeout, headers=headers)
+
+    @staticmethod
+    def _closing(items, http_client):
+        try:
+            for item in items:
+                yield item
+        finally:
+            items.close()
+            http_client.close()
+
+    @classmethod
+    def _page_url(cls, url, page_number):
+        scheme, netloc, path, query, fragment = urlparse.urlsplit(url)
+        params = [(name, value) for name, value in urlparse.parse_qsl(query) if name != 'page']
+        params.append(('page', page_number))
+        return urlparse.urlunsplit((scheme, netloc, path, urllib.urlencode(params), ''))
+
     class ReviewSnippet(Base):
 
         _review_text_locator = (By.CSS_SELECTOR, ".description")
@@ -9,9 +9,8 @@ import re
 from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.support.ui import WebDriverWait
 
-from pages.page import Page
+from pages.page import Page, memoize_per_page_load
 
 
 class Base(Page):
@@ -36,8 +35,7 @@ class Base(Page):
 
     @property
     def page_title(self):
-        WebDriverWait(self.selenium, 10).until(lambda s: self.selenium.title)
-        return self.selenium.title
+        return self._wait_for_title()
 
     @property
     def is_amo_logo_visible(self):
@@ -100,7 +98,7 @@ class Base(Page):
         Returns:
           ['2010-05-09T00:00:00','2011-06-11T00:00:00']
         """
-        addon_dates = [element.text for element in self.selenium.find_elements(*locator)]
+        addon_dates = self._read_texts(*locator)
 
         iso_dates = [
             datetime.strptime(s, date_format).isoformat()
@@ -113,7 +111,7 @@ class Base(Page):
         Returns a list of integers extracted from the text elements
         matched by the given xpath_locator and regex_pattern.
         """
-        addon_numbers = [element.text for element in self.selenium.find_elements(*locator)]
+        addon_numbers = self._read_texts(*locator)
 
         integer_numbers = [
             int(re.search(regex_pattern, str(x).replace(",", "")).group(1))
@@ -150,6 +148,7 @@ class Base(Page):
             raise Exception("Menu not found: '%s'. Menus: %s" % (value, [menu.name for menu in self.site_navigation_menus]))
 
         @property
+        @memoize_per_page_load
         def site_navigation_menus(self):
             #returns a list containing all the site navigation menus
             from pages.desktop.regions.header_menu import HeaderMenu
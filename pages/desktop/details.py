@@ -9,10 +9,9 @@ import time
 
 from urllib2 import urlparse
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.action_chains import ActionChains
 
-from pages.page import Page
+from pages.page import Field, Page, PageRecord, memoize_per_page_load
 from pages.desktop.base import Base
 
 
@@ -97,31 +96,74 @@ class Details(Base):
     _contribute_button_locator = (By.ID, 'contribute-button')
     _paypal_login_dialog_locator = (By.ID, 'wrapper')
 
-    def __init__(self, testsetup, addon_name=None):
+    # the header and sidebar, read at once by hydrate
+    _hydrated_fields = {
+        'heading': Field(_title_locator),
+        'version_number': Field(_version_number_locator),
+        'no_restart': Field(_no_restart_locator),
+        'authors': Field(_authors_locator, many=True),
+        'summary': Field(_summary_locator),
+        'rating': Field(_rating_locator),
+        'total_reviews': Field(_review_link_locator),
+        'daily_users': Field(_daily_users_link_locator),
+        'breadcrumb': Field(_breadcrumb_locator),
+        'register_link': Field(_register_link_locator),
+        'license_site': Field(_license_link_locator, 'href'),
+        'icon_url': Field(_icon_locator, 'src'),
+        'website': Field(_website_locator, 'href'),
+        'support_url': Field(_support_link_locator, 'href')}
+
+    def __init__(self, testsetup, addon_name=None, shared_pages=None):
+        """
+        Opens the details page of addon_name. With shared_pages, a page left
+        untouched by an earlier test is used without loading it again.
+        """
         #formats name for url
         Base.__init__(self, testsetup)
         if (addon_name != None):
             self.addon_name = addon_name.replace(" ", "-")
             self.addon_name = re.sub(r'[^A-Za-z0-9\-]', '', self.addon_name).lower()
             self.addon_name = self.addon_name[:27]
-            self.selenium.get("%s/addon/%s" % (self.base_url, self.addon_name))
+            url = "%s/addon/%s" % (self.base_url, self.addon_name)
+            if shared_pages is None:
+                self.selenium.get(url)
+            else:
+                shared_pages.open(self.selenium, url)
 
     @property
     def _page_title(self):
         return "%s :: Add-ons for Firefox" % self.title
 
+    @memoize_per_page_load
+    def hydrate(self):
+        """
+        Reads every field of _hydrated_fields with one execute_read_script call
+        into a PageRecord. The properties of those fields, like title,
+        authors or daily_users_number, read from it until the browser loads
+        another page.
+        """
+        return self._read_fields(self._hydrated_fields)
+
+    def _hydrated(self, name):
+        value = getattr(self.hydrate(), name)
+        if value is None or value == []:
+            # not rendered when the page was read, wait for it as before
+            field = self._hydrated_fields[name]
+            if field.many:
+                value = [field.read(element) for element in self.selenium.find_elements(*field.locator)]
+            else:
+                value = field.read(self.selenium.find_element(*field.locator))
+        return value
+
     @property
     def title(self):
-        base = self.selenium.find_element(*self._title_locator).text
+        base = self._hydrated('heading')
         '''base = "firebug 1.8.9" we will have to remove version number for it'''
         return base.replace(self.version_number, '').replace(self.no_restart, '').strip()
 
     @property
     def no_restart(self):
-        try:
-            return self.selenium.find_element(*self._no_restart_locator).text
-        except:
-            return ""
+        return self.hydrate().no_restart or ""
 
     @property
     def has_reviews(self):
@@ -136,7 +178,7 @@ class Details(Base):
 
     @property
     def total_reviews_count(self):
-        text = self.selenium.find_element(*self._review_link_locator).text
+        text = self._hydrated('total_reviews')
         return int(text.split()[0].replace(',', ''))
 
     def click_view_statistics(self):
@@ -146,16 +188,16 @@ class Details(Base):
 
     @property
     def daily_users_number(self):
-        text = self.selenium.find_element(*self._daily_users_link_locator).text
+        text = self._hydrated('daily_users')
         return int(text.split()[0].replace(',', ''))
 
     @property
     def breadcrumb(self):
-        return self.selenium.find_element(*self._breadcrumb_locator).text
+        return self._hydrated('breadcrumb')
 
     @property
     def version_number(self):
-        return self.selenium.find_element(*self._version_number_locator).text
+        return self._hydrated('version_number')
 
     @property
     def source_code_license_information(self):
@@ -163,15 +205,15 @@ class Details(Base):
 
     @property
     def authors(self):
-        return [element.text for element in self.selenium.find_elements(*self._authors_locator)]
+        return self._hydrated('authors')
 
     @property
     def summary(self):
-        return self.selenium.find_element(*self._summary_locator).text
+        return self._hydrated('summary')
 
     @property
     def rating(self):
-        return self.selenium.find_element(*self._rating_locator).text
+        return self._hydrated('rating')
 
     def click_whats_this_license(self):
         self.selenium.find_element(*self._whats_this_license_locator).click()
@@ -180,7 +222,7 @@ class Details(Base):
 
     @property
     def license_site(self):
-        return self.selenium.find_element(*self._license_link_locator).get_attribute('href')
+        return self._hydrated('license_site')
 
     @property
     def license_link_text(self):
@@ -192,7 +234,7 @@ class Details(Base):
 
     @property
     def register_link(self):
-        return self.selenium.find_element(*self._register_link_locator).text
+        return self._hydrated('register_link')
 
     @property
     def login_link(self):
@@ -279,7 +321,7 @@ class Details(Base):
         If the offset is > 1000, the page has scrolled to the information section and it
         is in view.
         """
-        return (self.selenium.execute_script('return window.pageYOffset')) > 1000
+        return self.selenium.execute_read_script('return window.pageYOffset') > 1000
 
     @property
     def is_often_used_with_list_visible(self):
@@ -338,7 +380,7 @@ class Details(Base):
 
     @property
     def is_reviews_section_in_view(self):
-        return self.selenium.execute_script('return window.pageYOffset') > 1000
+        return self.selenium.execute_read_script('return window.pageYOffset') > 1000
 
     @property
     def is_reviews_section_visible(self):
@@ -366,18 +408,18 @@ class Details(Base):
 
     @property
     def icon_url(self):
-        return self.selenium.find_element(*self._icon_locator).get_attribute('src')
+        return self._hydrated('icon_url')
 
     @property
     def website(self):
-        return self.selenium.find_element(*self._website_locator).get_attribute('href')
+        return self._hydrated('website')
 
     def click_website_link(self):
         self.selenium.find_element(*self._website_locator).click()
 
     @property
     def support_url(self):
-        support_url = self.selenium.find_element(*self._support_link_locator).get_attribute('href')
+        support_url = self._hydrated('support_url')
         match = re.findall("http", support_url)
         #staging url
         if len(match) > 1:
@@ -407,6 +449,7 @@ class Details(Base):
             return 0
 
     @property
+    @memoize_per_page_load
     def previewer(self):
         return self.ImagePreviewer(self.testsetup)
 
@@ -429,6 +472,11 @@ class Details(Base):
 
         _image_locator = (By.CSS_SELECTOR, '#preview li')
         _link_locator = (By.TAG_NAME, 'a')
+        _image_link_locator = (By.CSS_SELECTOR, '#preview li a')
+        _image_source_locator = (By.TAG_NAME, 'img')
+
+        # the carousel shows this many previews at a time
+        images_per_set = 3
 
         def next_set(self):
             self.selenium.find_element(*self._next_locator).click()
@@ -443,24 +491,43 @@ class Details(Base):
             image_viewer = ImageViewer(self.testsetup)
             return image_viewer
 
+        @property
+        @memoize_per_page_load
+        def previews(self):
+            """
+            Every preview of the carousel, read with one script call and
+            without moving it. Each is a PageRecord with its index, title,
+            image link and the carousel set it belongs to.
+            """
+            rows = self._read_elements(self._image_link_locator, attributes=['title'],
+                                       fields={'link': Field(self._image_source_locator, 'src')})
+            return [PageRecord({'index': i, 'title': row['title'], 'link': row['link'],
+                                'set': i / self.images_per_set})
+                    for i, row in enumerate(rows)]
+
+        @property
+        def sets(self):
+            """The previews as the carousel shows them, one list per set."""
+            sets = []
+            for preview in self.previews:
+                if preview.set == len(sets):
+                    sets.append([])
+                sets[preview.set].append(preview)
+            return sets
+
         def image_title(self, image_no):
-            return self.selenium.find_element(self._image_locator[0],
-                        '%s:nth-child(%s) a' % (self._image_locator[1], image_no + 1)).get_attribute('title')
+            return self.previews[image_no].title
 
         def image_link(self, image_no):
-            return self.selenium.find_element(self._image_locator[0],
-                        '%s:nth-child(%s) a img' % (self._image_locator[1], image_no + 1)).get_attribute('src')
+            return self.previews[image_no].link
 
         @property
         def image_count(self):
-            return len(self.selenium.find_elements(*self._image_locator))
+            return len(self.previews)
 
         @property
         def image_set_count(self):
-            if self.image_count % 3 == 0:
-                return self.image_count / 3
-            else:
-                return self.image_count / 3 + 1
+            return len(self.sets)
 
     def review(self, element):
         return self.DetailsReviewSnippet(self.testsetup, element)
@@ -470,6 +537,15 @@ class Details(Base):
         return [self.DetailsReviewSnippet(self.testsetup, element)
                 for element in self.selenium.find_elements(*self._reviews_locator)]
 
+    def iter_all_reviews(self, max_pages=2):
+        """
+        Yields every review of the add-on from all pages of its reviews
+        listing without leaving this page, see ViewReviews.iter_reviews.
+        """
+        from pages.desktop.addons_site import ViewReviews
+        url = self.selenium.find_element(*self._all_reviews_link_locator).get_attribute('href')
+        return ViewReviews.iter_reviews(self.testsetup, url, max_pages)
+
     @property
     def version_info_link(self):
         return self.selenium.find_element(*self._info_link_locator).get_attribute('href')
@@ -479,7 +555,7 @@ class Details(Base):
 
     def click_user_reviews_link(self):
         self.selenium.find_element(*self._review_link_locator).click()
-        WebDriverWait(self.selenium, 10).until(lambda s: (self.selenium.execute_script('return window.pageYOffset')) > 1000)
+        self._wait_until('return window.pageYOffset > 1000;')
 
     def click_version_information_header(self):
         self.selenium.find_element(*self._version_information_heading_link_locator).click()
@@ -571,7 +647,7 @@ class Details(Base):
         return self.is_element_visible(*self._paypal_login_dialog_locator)
 
     def _wait_for_favorite_addon_to_be_added(self):
-        WebDriverWait(self.selenium, 10).until(lambda s: not self.is_element_present(*self._add_to_favorites_updating_locator))
+        self._wait_for_element_not_present(self._add_to_favorites_updating_locator)
 
     def click_add_to_favorites(self):
         self.selenium.find_element(*self._add_to_favorites_widget_locator).click()
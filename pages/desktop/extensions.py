@@ -7,7 +7,6 @@
 from time import strptime, mktime
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.action_chains import ActionChains
 
 from pages.page import Page
@@ -40,7 +39,7 @@ class ExtensionsHome(Base):
         return self.selenium.find_element(*self._default_selected_tab_locator).text
 
     def _wait_for_results_refresh(self):
-        WebDriverWait(self.selenium, 10).until(lambda s: not self.is_element_present(*self._updating_locator))
+        self._wait_for_element_not_present(self._updating_locator)
 
     def sort_by(self, type):
         hover_element = self.selenium.find_element(*self._hover_more_locator)
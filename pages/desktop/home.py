@@ -125,8 +125,10 @@ class Home(Base):
 
     @property
     def most_popular_items(self):
-        return [self.MostPopularRegion(self.testsetup, element)
-                for element in self.selenium.find_elements(*self._most_popular_item_locator)]
+        items = self._read_elements(self._most_popular_item_locator,
+                                    fields={'name': self.MostPopularRegion._name_locator,
+                                            'users': self.MostPopularRegion._users_locator})
+        return [self.MostPopularRegion(self.testsetup, item['element'], item) for item in items]
 
     class Categories(Page):
         _link_locator = (By.CSS_SELECTOR, 'a')
@@ -148,15 +150,21 @@ class Home(Base):
         _name_locator = (By.TAG_NAME, "span")
         _users_locator = (By.CSS_SELECTOR, "small")
 
-        def __init__(self, testsetup, element):
+        def __init__(self, testsetup, element, texts=None):
             Page.__init__(self, testsetup)
             self._root_element = element
+            # texts already read by Home.most_popular_items
+            self._texts = texts or {}
 
         @property
         def name(self):
-            self._root_element.find_element(*self._name_locator).text
+            if self._texts.get('name') is not None:
+                return self._texts['name']
+            return self._root_element.find_element(*self._name_locator).text
 
         @property
         def users_number(self):
-            users_text = self._root_element.find_element(*self._users_locator).text
+            users_text = self._texts.get('users')
+            if users_text is None:
+                users_text = self._root_element.find_element(*self._users_locator).text
             return int(users_text.split(' ')[0].replace(',', ''))
@@ -46,7 +46,7 @@ class Personas(Base):
 
     @property
     def is_featured_addons_present(self):
-        return len(self.selenium.find_elements(*self._featured_addons_locator)) > 0
+        return self.is_element_present(*self._featured_addons_locator)
 
     @property
     def featured_personas_count(self):
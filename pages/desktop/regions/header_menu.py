@@ -7,7 +7,7 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 
-from pages.page import Page
+from pages.page import Page, memoize_per_page_load
 
 
 class HeaderMenu(Page):
@@ -29,6 +29,7 @@ class HeaderMenu(Page):
         self._root_element = element
 
     @property
+    @memoize_per_page_load
     def name(self):
         return self._root_element.find_element(*self._name_locator).text
 
@@ -59,6 +60,7 @@ class HeaderMenu(Page):
         return dropdown_menu.is_displayed()
 
     @property
+    @memoize_per_page_load
     def items(self):
         return [self.HeaderMenuItem(self.testsetup, element, self)
                 for element in self._root_element.find_elements(*self._menu_items_locator)]
@@ -73,6 +75,7 @@ class HeaderMenu(Page):
             self._menu = menu
 
         @property
+        @memoize_per_page_load
         def name(self):
             self._menu.hover()
             return self._root_element.find_element(*self._name_locator).text
@@ -5,9 +5,8 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 
-from pages.page import Page
+from pages.page import Field, Page
 
 
 class ImageViewer(Page):
@@ -43,6 +42,16 @@ class ImageViewer(Page):
     def image_link(self):
         return self.selenium.find_element(*self._current_image_locator).get_attribute('src')
 
+    @property
+    def image_links(self):
+        """
+        The link of every image in the viewer in order, read with one
+        script call, so all of them can be checked without clicking through.
+        Images without a src yet are left out.
+        """
+        links = self._read_fields({'links': Field(self._images_locator, 'src', many=True)}).links
+        return [link for link in links if link]
+
     def click_next(self):
         self.selenium.find_element(*self._next_locator).click()
 
@@ -51,7 +60,7 @@ class ImageViewer(Page):
 
     def close(self):
         self.selenium.find_element(*self._close_locator).click()
-        WebDriverWait(self.selenium, 10).until(lambda s: not self.is_element_visible(*self._image_viewer))
+        self._wait_for_element_not_visible(self._image_viewer)
 
     @property
     def caption(self):
@@ -8,7 +8,6 @@
 from time import strptime, mktime
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.action_chains import ActionChains
 
 from pages.page import Page
@@ -39,7 +38,7 @@ class SearchHome(Base):
     _updating_locator = (By.CSS_SELECTOR, "div.updating")
 
     def wait_for_results_refresh(self):
-        WebDriverWait(self.selenium, 10).until(lambda s: not self.is_element_present(*self._updating_locator))
+        self._wait_for_element_not_present(self._updating_locator)
 
     @property
     def is_no_results_present(self):
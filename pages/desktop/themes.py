@@ -67,15 +67,14 @@ class Themes(Base):
 
     @property
     def get_all_categories(self):
-        return [element.text for element in self.selenium.find_elements(*self._categories_locator)]
+        return self._read_texts(*self._categories_locator)
 
     @property
     def addon_names(self):
-        addon_name = []
-        for addon in self._addons_root_element.find_elements(*self._addon_name_locator):
-            ActionChains(self.selenium).move_to_element(addon).perform()
-            addon_name.append(addon.text)
-        return addon_name
+        # the names are read in the page, hidden ones too, so there is no
+        # need to hover over each addon first
+        return [addon['text'] for addon in
+                self._read_elements(self._addon_name_locator, root=self._addons_root_element)]
 
     def addon_name(self, lookup):
         return self.selenium.find_element(By.CSS_SELECTOR,
@@ -107,7 +106,7 @@ class Themes(Base):
 
     @property
     def themes(self):
-        return [self.Theme(self.testsetup, theme)for theme in self.selenium.find_elements(*self._addons_root_locator)]
+        return [self.Theme(self.testsetup, theme) for theme in self.selenium.find_elements(*self._addons_root_locator)]
 
     class Theme(Page):
 
@@ -128,12 +127,7 @@ class Themes(Base):
 
         @property
         def is_incompatible_flag_present(self):
-            from selenium.common.exceptions import NoSuchElementException
-            try:
-                self._root_element.find_element(*self._not_compatible_locator)
-                return True
-            except NoSuchElementException:
-                return False
+            return self._find_optional_element(self._not_compatible_locator, self._root_element) is not None
 
 
 class Theme(Base):
@@ -6,7 +6,6 @@
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
 
 from pages.desktop.base import Base
 from pages.page import Page
@@ -42,7 +41,7 @@ class Login(Base):
         from browserid import BrowserID
         pop_up = BrowserID(self.selenium, self.timeout)
         pop_up.sign_in(credentials['email'], credentials['password'])
-        WebDriverWait(self.selenium, 20).until(lambda s: s.find_element(*self._logout_locator))
+        self._wait_for_element_present(self._logout_locator, timeout=20)
 
 
 class ViewProfile(Base):
@@ -0,0 +1,313 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from contextlib import contextmanager
+from functools import partial
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+from pages.snapshot import Snapshot, SnapshotElement
+
+# Commands that only read from the browser. Every other command may change
+# the page and starts a new page epoch.
+_READ_ONLY_COMMANDS = frozenset([
+    'findElement', 'findElements', 'findChildElement', 'findChildElements',
+    'getElementText', 'getElementValue', 'getElementTagName', 'getElementAttribute',
+    'getElementLocation', 'getElementSize', 'getElementValueOfCssProperty',
+    'isElementSelected', 'isElementEnabled', 'isElementDisplayed', 'elementEquals',
+    'getTitle', 'getCurrentUrl', 'getPageSource', 'getCookies', 'getCookie',
+    'getWindowHandles', 'getCurrentWindowHandle', 'getWindowSize', 'getWindowPosition',
+    'screenshot', 'implicitlyWait', 'setScriptTimeout', 'getAlertText'])
+
+# Commands that always load a page, even the same one again.
+_NAVIGATION_COMMANDS = frozenset(['get', 'goBack', 'goForward', 'refresh'])
+
+# Installs a MutationObserver in the page on first use and returns a value
+# that changes with every change to the document, or null if the browser
+# cannot observe them.
+_MUTATIONS_SCRIPT = """
+if (!window.MutationObserver) {
+    return null;
+}
+var state = window.__addonTestsMutations;
+if (!state) {
+    state = window.__addonTestsMutations = {page: String(Math.random()).slice(2), count: 0};
+    new MutationObserver(function () { state.count++; }).observe(document, {
+        childList: true, subtree: true, attributes: true, characterData: true});
+}
+return state.page + ':' + state.count;
+"""
+
+
+def hook_commands(selenium, name, hook):
+    """
+    Routes every command of a WebDriver through hook(execute, driver_command,
+    params), which sends it on with execute.
+
+    WebElements send their commands through the execute of the driver that
+    found them, so replacing it on the instance catches theirs too. Hooks
+    are kept by name and adding one again replaces it, so a pooled browser
+    is not wrapped again by every test. The hook added last runs first.
+    """
+    hooks = getattr(selenium, '_command_hooks', None)
+    if hooks is None:
+        hooks = selenium._command_hooks = []
+        selenium._send_command = selenium.execute
+
+        def execute(driver_command, params=None):
+            return execute_hooked(selenium, driver_command, params)
+        selenium.execute = execute
+    for index, (hook_name, existing_hook) in enumerate(hooks):
+        if hook_name == name:
+            hooks[index] = (name, hook)
+            return
+    hooks.append((name, hook))
+
+
+def execute_hooked(selenium, driver_command, params=None, skip=None):
+    """Sends a command through every hook of hook_commands but the one named skip."""
+    execute = selenium._send_command
+    for name, hook in selenium._command_hooks:
+        if name != skip:
+            execute = partial(hook, execute)
+    return execute(driver_command, params)
+
+
+class Driver(object):
+    """
+    Wraps the WebDriver of a test and passes everything through to it.
+
+    The implicit wait and script timeout applied in the browser are
+    remembered, so implicitly_wait and set_script_timeout only send a
+    command when the value changes.
+
+    page_epoch counts the commands that may have changed the page, like
+    get, click or execute_script, including the ones sent by WebElements,
+    see hook_commands.
+    Inside snapshot() find_element(s) are answered from a parsed copy of the
+    page source that is fetched again whenever page_epoch has moved on.
+
+    find_element remembers the element found for each locator until
+    page_epoch moves on or a MutationObserver in the page reports a change.
+    The observer is installed before the first element of a page epoch is
+    found and asked again before every reuse, so an element is only reused
+    while the document is unchanged. An element that went stale anyway is
+    found again and the command retried.
+
+    navigation_epoch changes whenever another page is loaded, see
+    memoize_per_page_load.
+    """
+
+    cache_elements = True
+
+    def __init__(self, selenium, implicit_wait):
+        self._selenium = selenium
+        self._implicit_wait = implicit_wait
+        self._script_timeout = None
+        self.page_epoch = 0
+        self._snapshot = None
+        self._snapshot_epoch = None
+        self._snapshot_depth = 0
+        self._elements = {}
+        self._elements_epoch = None
+        self._mutations = None
+        self._mutations_observed = False
+        self._navigations = 0
+        self._url = None
+        self._url_epoch = None
+
+        def track(execute, driver_command, params):
+            if driver_command not in _READ_ONLY_COMMANDS:
+                self.page_epoch += 1
+            if driver_command in _NAVIGATION_COMMANDS:
+                self._navigations += 1
+            return execute(driver_command, params)
+
+        hook_commands(selenium, 'driver', track)
+
+    def __getattr__(self, name):
+        return getattr(self._selenium, name)
+
+    @property
+    def wrapped_driver(self):
+        return self._selenium
+
+    @property
+    def implicit_wait(self):
+        return self._implicit_wait
+
+    def implicitly_wait(self, time_to_wait):
+        if time_to_wait != self._implicit_wait:
+            self._selenium.implicitly_wait(time_to_wait)
+            self._implicit_wait = time_to_wait
+
+    def set_script_timeout(self, time_to_wait):
+        if time_to_wait != self._script_timeout:
+            self._selenium.set_script_timeout(time_to_wait)
+            self._script_timeout = time_to_wait
+
+    @contextmanager
+    def no_implicit_wait(self):
+        """
+        Sets the implicit wait to 0 for the body of a with statement, so a
+        batch of presence checks costs one command on either side of it.
+        Lookups in a snapshot never wait, so nothing is sent in one.
+        """
+        if self.snapshot_active:
+            yield self
+            return
+        previous = self._implicit_wait
+        self.implicitly_wait(0)
+        try:
+            yield self
+        finally:
+            self.implicitly_wait(previous)
+
+    @property
+    def navigation_epoch(self):
+        # a click may have loaded another page, which only the url tells
+        if self._url_epoch != self.page_epoch:
+            url = self._selenium.current_url
+            if url != self._url:
+                self._navigations += 1
+                self._url = url
+            self._url_epoch = self.page_epoch
+        return self._navigations
+
+    @property
+    def snapshot_active(self):
+        return self._snapshot_depth > 0
+
+    @contextmanager
+    def snapshot(self):
+        """
+        Answers find_element(s) from a copy of the page source for the body
+        of a with statement. Only use it around reads: the copy does not
+        see changes made by the page's own scripts, so waiting for one in a
+        snapshot times out.
+        """
+        self._snapshot_depth += 1
+        try:
+            yield self
+        finally:
+            self._snapshot_depth -= 1
+            if not self._snapshot_depth:
+                self._snapshot = None
+
+    def find_element(self, by=By.ID, value=None):
+        if self.snapshot_active:
+            return self._current_snapshot().find_element(by, value)
+        if not self.cache_elements:
+            return self._selenium.find_element(by, value)
+        element = self._cached_element(by, value)
+        if element is None:
+            if not self._mutations_observed:
+                # count from before the lookup, so no later change is missed
+                self._mutations = self._read_mutations()
+                self._mutations_observed = True
+            element = _CachedElement(self._selenium, by, value, self._selenium.find_element(by, value))
+            if self._mutations is not None:
+                self._elements[(by, value)] = element
+        return element
+
+    def find_elements(self, by=By.ID, value=None):
+        if self.snapshot_active:
+            return self._current_snapshot().find_elements(by, value)
+        return self._selenium.find_elements(by, value)
+
+    def execute_script(self, script, *args):
+        return self._selenium.execute_script(script, *[_unwrap(arg) for arg in args])
+
+    def execute_async_script(self, script, *args):
+        return self._selenium.execute_async_script(script, *[_unwrap(arg) for arg in args])
+
+    def execute_read_script(self, script, *args):
+        """
+        Runs a script that only reads from the page like execute_script, but
+        leaves page_epoch alone, so cached elements and memoized page state
+        stay valid.
+        """
+        params = {'script': script, 'args': [_unwrap(arg) for arg in args]}
+        return execute_hooked(self._selenium, 'executeScript', params, skip='driver')['value']
+
+    def _cached_element(self, by, value):
+        if self._elements_epoch != self.page_epoch:
+            self._elements.clear()
+            self._elements_epoch = self.page_epoch
+            # the observer count of the last page says nothing about this one
+            self._mutations = None
+            self._mutations_observed = False
+            return None
+        element = self._elements.get((by, value))
+        if element is None:
+            return None
+        mutations = self._read_mutations()
+        if mutations != self._mutations:
+            self._elements.clear()
+            self._mutations = mutations
+            return None
+        return element
+
+    def _read_mutations(self):
+        # sent past the page epoch, as it only reads the count
+        return execute_hooked(self._selenium, 'executeScript',
+                              {'script': _MUTATIONS_SCRIPT, 'args': []}, skip='driver')['value']
+
+    def _current_snapshot(self):
+        if self._snapshot is None or self._snapshot_epoch != self.page_epoch:
+            self._snapshot = Snapshot(self._selenium, self._selenium.page_source)
+            self._snapshot_epoch = self.page_epoch
+        return self._snapshot
+
+
+class _CachedElement(object):
+    """
+    A WebElement kept by Driver.find_element. When the element has gone
+    stale, it is found again with its locator and the command is retried.
+    """
+
+    def __init__(self, selenium, by, value, element):
+        self._selenium = selenium
+        self._by = by
+        self._value = value
+        self.wrapped_element = element
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        try:
+            attribute = getattr(self.wrapped_element, name)
+        except StaleElementReferenceException:
+            self._find_again()
+            attribute = getattr(self.wrapped_element, name)
+        if not callable(attribute):
+            return attribute
+
+        def call(*args, **kwargs):
+            try:
+                return getattr(self.wrapped_element, name)(*args, **kwargs)
+            except StaleElementReferenceException:
+                self._find_again()
+                return getattr(self.wrapped_element, name)(*args, **kwargs)
+        return call
+
+    def _find_again(self):
+        self.wrapped_element = self._selenium.find_element(self._by, self._value)
+
+
+def _unwrap(value):
+    # selenium only serializes WebElements as elements, also inside lists
+    # and dictionaries
+    if isinstance(value, _CachedElement):
+        return value.wrapped_element
+    if isinstance(value, SnapshotElement):
+        return value.live_element
+    if isinstance(value, (list, tuple)):
+        return [_unwrap(item) for item in value]
+    if isinstance(value, dict):
+        return dict((key, _unwrap(item)) for key, item in value.items())
+    return value
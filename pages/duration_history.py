@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import json
+import os
+
+
+class DurationHistory(object):
+    """
+    The seconds each test took the last time it ran, keyed by node id and
+    kept in a json file between runs.
+
+    A test costs its setup, call and teardown together, so the browser
+    start of the plugin is part of it. Tests without a history are
+    expected to take as long as the average test.
+    """
+
+    def __init__(self, path, durations=None):
+        self.path = path
+        if durations is None:
+            durations = self._load()
+        self.durations = durations
+        self._current = {}
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        history_file = open(self.path)
+        try:
+            return json.load(history_file)
+        except ValueError:
+            # a run that was killed while saving, start over
+            return {}
+        finally:
+            history_file.close()
+
+    def add(self, nodeid, seconds):
+        """Adds the duration of one phase of a test that ran in this session."""
+        self._current[nodeid] = self._current.get(nodeid, 0.0) + seconds
+
+    def save(self):
+        if not self._current:
+            return
+        self.durations.update(self._current)
+        history_file = open(self.path, 'w')
+        try:
+            json.dump(self.durations, history_file, indent=2, sort_keys=True)
+        finally:
+            history_file.close()
+
+    def estimate(self, nodeid):
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        if not self.durations:
+            return 0.0
+        return sum(self.durations.values()) / len(self.durations)
+
+    def longest_first(self, items):
+        """
+        Sorts test items from the longest to the shortest, keeping the
+        collection order among tests that take equally long.
+
+        xdist sends the next pending test to whichever worker runs low, so
+        in this order it schedules longest processing time first: the long
+        tests are spread over the workers early on and the short ones even
+        out the finish at the end.
+        """
+        items.sort(key=lambda item: self.estimate(item.nodeid), reverse=True)
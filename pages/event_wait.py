@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import re
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from pages.page import _FIND_FUNCTION
+
+# How Firefox ("Detected a page unload event") and Chrome ("document
+# unloaded while waiting for result") report a page left by an async script.
+_PAGE_UNLOAD = re.compile('unload', re.IGNORECASE)
+
+# Evaluates the condition whenever something happens in the page that could
+# change its outcome and calls back as soon as it holds, or with [false]
+# once the timeout has passed.
+_WAIT_SCRIPT = _FIND_FUNCTION + """
+var condition = new Function('args', 'first', 'isShown', arguments[0]),
+    args = arguments[1], timeout = arguments[2],
+    callback = arguments[arguments.length - 1];
+var done = false, observer = null, timers = [],
+    events = ['transitionend', 'webkitTransitionEnd', 'animationend', 'scroll', 'load'];
+
+function first(locator) {
+    return find(document, locator)[0] || null;
+}
+
+function isShown(element) {
+    if (!element.offsetWidth && !element.offsetHeight) {
+        return false;
+    }
+    for (var node = element; node && node.nodeType == 1; node = node.parentNode) {
+        var style = window.getComputedStyle(node, null);
+        if (style.display == 'none' || style.visibility == 'hidden' || style.opacity == '0') {
+            return false;
+        }
+    }
+    return true;
+}
+
+function finish(result) {
+    if (done) {
+        return;
+    }
+    done = true;
+    if (observer) {
+        observer.disconnect();
+    }
+    clearInterval(timers[0]);
+    clearTimeout(timers[1]);
+    for (var i = 0; i < events.length; i++) {
+        document.removeEventListener(events[i], check, true);
+    }
+    if (window.jQuery) {
+        window.jQuery(document).unbind('ajaxStop', check);
+    }
+    callback(result);
+}
+
+function check() {
+    var value;
+    try {
+        value = condition(args, first, isShown);
+    } catch (e) {
+        return;
+    }
+    if (value) {
+        finish([true, value]);
+    }
+}
+
+check();
+if (!done) {
+    if (window.MutationObserver) {
+        observer = new MutationObserver(check);
+        observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    }
+    for (var i = 0; i < events.length; i++) {
+        document.addEventListener(events[i], check, true);
+    }
+    if (window.jQuery) {
+        window.jQuery(document).bind('ajaxStop', check);
+    }
+    // for changes no listener sees, and browsers without MutationObserver
+    timers.push(setInterval(check, 250));
+    timers.push(setTimeout(function () { finish([false]); }, timeout));
+}
+"""
+
+
+class EventWait(object):
+    """
+    Waits for a condition in the page with one execute_async_script call.
+
+    The condition is the body of a javascript function that is evaluated
+    right away and again on every DOM mutation, jQuery ajaxStop,
+    transitionend or scroll event until it returns a true value, which is
+    returned by until. In the body, args holds the extra arguments of
+    until, first(locator) returns the first element matched by a locator
+    from Page._script_locator and isShown(element) tells if an element is
+    displayed.
+
+        EventWait(self.selenium, 10).until('return !first(args[0]);', locator)
+
+    If the page is left while waiting, the wait starts over on the next one.
+    Any other error, like a script error in the condition or a closed
+    window, is raised right away.
+    """
+
+    def __init__(self, selenium, timeout):
+        self.selenium = selenium
+        self.timeout = timeout
+
+    def until(self, condition, *args):
+        end_time = time.time() + self.timeout
+        # the page gives up by itself, this only guards against a hung browser
+        self.selenium.set_script_timeout(self.timeout + 5)
+        while True:
+            remaining = end_time - time.time()
+            if remaining <= 0:
+                break
+            try:
+                result = self.selenium.execute_async_script(
+                    _WAIT_SCRIPT, condition, list(args), int(remaining * 1000))
+            except WebDriverException, e:
+                if not _PAGE_UNLOAD.search(e.msg or ''):
+                    raise
+                # the page was unloaded while the script was waiting
+                time.sleep(0.1)
+                continue
+            if result[0]:
+                return result[1]
+            break
+        raise TimeoutException('Timed out after %s seconds waiting for: %s' % (self.timeout, condition))
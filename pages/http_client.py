@@ -0,0 +1,318 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import base64
+import errno
+import gzip
+import hashlib
+import httplib
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+import urllib2
+import urlparse
+import zlib
+
+from StringIO import StringIO
+
+
+class HttpClient(object):
+    """
+    A small GET-only HTTP client for the AMO API and XML endpoints.
+
+    Connections are kept alive and reused per host, responses are requested
+    gzip compressed and, when a cache_dir is given, every response is kept on
+    disk and revalidated with If-None-Match / If-Modified-Since on the next
+    request, so an unchanged document costs a 304 instead of a download.
+
+    The disk cache is content addressed: bodies are stored under the sha1 of
+    their content and a small metadata file per url points at the body and
+    holds its validators. All files are written to a temporary name and
+    renamed into place, so several test runs or pytest-xdist workers can
+    share one cache_dir.
+    """
+
+    max_redirects = 5
+
+    def __init__(self, cache_dir=None, timeout=60, headers=None):
+        self.cache_dir = cache_dir
+        self.timeout = timeout
+        self.headers = headers or {}
+        self._idle_connections = {}
+        self._lock = threading.Lock()
+
+    def get(self, url):
+        """Returns the body of url, following redirects."""
+        return self.fetch(url)[1]
+
+    def fetch(self, url):
+        """Returns the url redirects ended at and its body."""
+        for redirect in range(self.max_redirects + 1):
+            cached = self._read_cache(url)
+            headers = dict(self.headers)
+            headers['Accept-Encoding'] = 'gzip'
+            if cached is not None:
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    headers['If-Modified-Since'] = cached['last_modified']
+
+            status, reason, response_headers, body = self._request(url, headers)
+
+            if status in (301, 302, 303, 307) and 'location' in response_headers:
+                url = urlparse.urljoin(url, response_headers['location'])
+                continue
+            if status == 304 and cached is not None:
+                body = self._read_body(cached['body'])
+                if body is not None:
+                    return url, body
+                # the body was removed from under us, fetch it again
+                self._remove_cache(url)
+                continue
+            if response_headers.get('content-encoding') == 'gzip':
+                body = zlib.decompress(body, 16 + zlib.MAX_WBITS)
+            if status != 200:
+                # the error page the server sent can be read from the error
+                raise urllib2.HTTPError(url, status, reason, response_headers, StringIO(body))
+            self._write_cache(url, response_headers, body)
+            return url, body
+        raise urllib2.URLError('Too many redirects for %s' % url)
+
+    def close(self):
+        self._lock.acquire()
+        try:
+            for connections in self._idle_connections.values():
+                for connection in connections:
+                    connection.close()
+            self._idle_connections.clear()
+        finally:
+            self._lock.release()
+
+    def _request(self, url, headers):
+        scheme, netloc, path, query, fragment = urlparse.urlsplit(url)
+        if query:
+            path = '%s?%s' % (path, query)
+
+        # a kept alive connection may have been closed by the server since
+        # it was last used, so retry once on a fresh one
+        for attempt in range(2):
+            connection = self._acquire(scheme, netloc)
+            try:
+                connection.request('GET', path or '/', headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (httplib.HTTPException, socket.error):
+                connection.close()
+                if attempt:
+                    raise
+                continue
+            response_headers = dict(response.getheaders())
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(scheme, netloc, connection)
+            return response.status, response.reason, response_headers, body
+
+    def _acquire(self, scheme, netloc):
+        self._lock.acquire()
+        try:
+            idle = self._idle_connections.get((scheme, netloc))
+            if idle:
+                return idle.pop()
+        finally:
+            self._lock.release()
+        if scheme == 'https':
+            return httplib.HTTPSConnection(netloc, timeout=self.timeout)
+        return httplib.HTTPConnection(netloc, timeout=self.timeout)
+
+    def _release(self, scheme, netloc, connection):
+        self._lock.acquire()
+        try:
+            self._idle_connections.setdefault((scheme, netloc), []).append(connection)
+        finally:
+            self._lock.release()
+
+    def _path(self, kind, key):
+        return os.path.join(self.cache_dir, kind, key[:2], key)
+
+    def _meta_path(self, url):
+        return self._path('meta', hashlib.sha1(url).hexdigest())
+
+    def _read_cache(self, url):
+        if not self.cache_dir:
+            return None
+        try:
+            meta_file = open(self._meta_path(url))
+            try:
+                return json.load(meta_file)
+            finally:
+                meta_file.close()
+        except (IOError, ValueError):
+            return None
+
+    def _read_body(self, digest):
+        try:
+            body_file = open(self._path('body', digest), 'rb')
+            try:
+                return body_file.read()
+            finally:
+                body_file.close()
+        except IOError:
+            return None
+
+    def _write_cache(self, url, response_headers, body):
+        if not self.cache_dir:
+            return
+        etag = response_headers.get('etag')
+        last_modified = response_headers.get('last-modified')
+        if not (etag or last_modified):
+            # nothing to revalidate with
+            return
+        digest = hashlib.sha1(body).hexdigest()
+        body_path = self._path('body', digest)
+        if not os.path.exists(body_path):
+            _write_atomically(body_path, body)
+        _write_atomically(self._meta_path(url), json.dumps({
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'body': digest}))
+
+    def _remove_cache(self, url):
+        try:
+            os.remove(self._meta_path(url))
+        except OSError:
+            pass
+
+
+class Cassette(object):
+    """
+    Response bodies recorded by url and saved to a gzipped JSON file.
+
+    Bodies are stored base64 encoded so they replay byte for byte. Saving
+    merges with whatever is already in the file under a lock file, so
+    pytest-xdist workers can record into the same cassette.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._responses = self._load()
+        self._lock = threading.Lock()
+
+    def __contains__(self, url):
+        return url in self._responses
+
+    def get(self, url):
+        return base64.b64decode(self._responses[url])
+
+    def put(self, url, body):
+        self._lock.acquire()
+        try:
+            self._responses[url] = base64.b64encode(body)
+        finally:
+            self._lock.release()
+
+    def save(self):
+        lock_path = self.path + '.lock'
+        waited = 0
+        while True:
+            try:
+                os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL))
+                break
+            except OSError, e:
+                if e.errno != errno.EEXIST:
+                    raise
+                if waited > 30:
+                    # left behind by a process that died while saving
+                    os.remove(lock_path)
+                    waited = 0
+                time.sleep(0.1)
+                waited += 0.1
+        try:
+            responses = self._load()
+            responses.update(self._responses)
+            data = StringIO()
+            cassette_file = gzip.GzipFile(fileobj=data, mode='wb')
+            cassette_file.write(json.dumps(responses, sort_keys=True))
+            cassette_file.close()
+            _write_atomically(self.path, data.getvalue())
+        finally:
+            os.remove(lock_path)
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        cassette_file = gzip.open(self.path, 'rb')
+        try:
+            return json.loads(cassette_file.read())
+        finally:
+            cassette_file.close()
+
+
+class RecordingClient(HttpClient):
+    """An HttpClient that also records every response into a cassette."""
+
+    def __init__(self, cassette, **kwargs):
+        HttpClient.__init__(self, **kwargs)
+        self.cassette = cassette
+
+    def fetch(self, url):
+        final_url, body = HttpClient.fetch(self, url)
+        self.cassette.put(url, body)
+        return final_url, body
+
+    def close(self):
+        HttpClient.close(self)
+        self.cassette.save()
+
+
+class ReplayClient(object):
+    """
+    Serves responses from a cassette without touching the network.
+
+    Redirects are not recorded, so fetch answers with the requested url.
+    """
+
+    def __init__(self, cassette):
+        self.cassette = cassette
+
+    def get(self, url):
+        return self.fetch(url)[1]
+
+    def fetch(self, url):
+        if url not in self.cassette:
+            raise urllib2.URLError('%s was not recorded in %s' % (url, self.cassette.path))
+        return url, self.cassette.get(url)
+
+    def close(self):
+        pass
+
+
+def _write_atomically(path, data):
+    directory = os.path.dirname(path) or os.curdir
+    try:
+        os.makedirs(directory)
+    except OSError, e:
+        if e.errno != errno.EEXIST:
+            raise
+    fd, temp_path = tempfile.mkstemp(dir=directory)
+    temp_file = os.fdopen(fd, 'wb')
+    try:
+        temp_file.write(data)
+    finally:
+        temp_file.close()
+    try:
+        os.rename(temp_path, path)
+    except OSError:
+        # windows will not rename over an existing file
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        os.rename(temp_path, path)
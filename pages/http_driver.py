@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import urllib2
+from contextlib import contextmanager
+
+from selenium.common.exceptions import WebDriverException
+
+from pages.snapshot import Snapshot, SnapshotElement
+
+
+class BrowserRequired(WebDriverException):
+    """Raised for everything an HttpDriver cannot do without a browser."""
+
+    def __init__(self, what):
+        WebDriverException.__init__(
+            self, '%s needs a browser, mark the test with @pytest.mark.browser' % what)
+
+
+class HttpDriver(object):
+    """
+    Stands in for the WebDriver of tests that only read server rendered
+    pages.
+
+    get downloads a page with an HttpClient and find_element(s) answer from
+    its parsed source like in Driver.snapshot, so reading the text and
+    attributes of elements costs no round trip at all. Like a browser, it
+    shows the page the server sent for any status, such as a 404 page.
+    Scripts never run, so anything that needs them or a rendered page, like
+    click or is_displayed, raises BrowserRequired.
+    """
+
+    # send these with every request of the http client, AMO renders some
+    # pages differently for other browsers
+    headers = {'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:10.0) Gecko/20100101 Firefox/10.0'}
+    runs_javascript = False
+    snapshot_active = True
+
+    def __init__(self, http_client):
+        self.http_client = http_client
+        self.page_epoch = 0
+        self._history = []
+        self._position = -1
+        self._snapshot = None
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        raise BrowserRequired(name)
+
+    @property
+    def navigation_epoch(self):
+        return self.page_epoch
+
+    @property
+    def current_url(self):
+        return self._history[self._position][0]
+
+    @property
+    def page_source(self):
+        return self._history[self._position][1]
+
+    @property
+    def title(self):
+        titles = self._page().tree.xpath('//title')
+        if not titles:
+            return ''
+        return titles[0].text_content().strip()
+
+    def get(self, url):
+        del self._history[self._position + 1:]
+        self._history.append(self._fetch(url))
+        self._position += 1
+        self._load()
+
+    def back(self):
+        if self._position > 0:
+            self._position -= 1
+            self._load()
+
+    def forward(self):
+        if self._position < len(self._history) - 1:
+            self._position += 1
+            self._load()
+
+    def refresh(self):
+        self._history[self._position] = self._fetch(self.current_url)
+        self._load()
+
+    def _fetch(self, url):
+        try:
+            return self.http_client.fetch(url)
+        except urllib2.HTTPError, e:
+            # a browser shows an empty page for an error without a body
+            return e.filename, e.read() or '<html></html>'
+
+    def _load(self):
+        self.page_epoch += 1
+        self._snapshot = None
+
+    def _page(self):
+        if self._snapshot is None:
+            if self._position < 0:
+                raise WebDriverException('No page has been loaded')
+            self._snapshot = _StaticSnapshot(self, self.page_source)
+        return self._snapshot
+
+    def find_element(self, by, value=None):
+        return self._page().find_element(by, value)
+
+    def find_elements(self, by, value=None):
+        return self._page().find_elements(by, value)
+
+    def implicitly_wait(self, time_to_wait):
+        pass
+
+    def set_script_timeout(self, time_to_wait):
+        pass
+
+    @contextmanager
+    def no_implicit_wait(self):
+        yield self
+
+    @contextmanager
+    def snapshot(self):
+        yield self
+
+    def execute_script(self, script, *args):
+        raise BrowserRequired('execute_script')
+
+    def execute_async_script(self, script, *args):
+        raise BrowserRequired('execute_async_script')
+
+    def execute_read_script(self, script, *args):
+        raise BrowserRequired('execute_read_script')
+
+    def delete_all_cookies(self):
+        pass
+
+    def quit(self):
+        pass
+
+
+class _StaticSnapshot(Snapshot):
+
+    def _element(self, node):
+        return _StaticElement(self, node)
+
+    def _find_live_elements(self, by, value, context):
+        raise BrowserRequired('find_elements by %s' % by)
+
+
+class _StaticElement(SnapshotElement):
+
+    @property
+    def live_element(self):
+        raise BrowserRequired('a rendered element')
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        raise BrowserRequired(name)
@@ -8,9 +8,200 @@ Created on Jun 21, 2010
 
 '''
 from unittestzero import Assert
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import NoSuchElementException
-from selenium.common.exceptions import ElementNotVisibleException
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import ElementNotVisibleException, TimeoutException
+
+# Finds the elements matched by a locator from Page._script_locator.
+_FIND_FUNCTION = """
+function find(context, locator) {
+    if (locator[0] != 'xpath') {
+        return context.querySelectorAll(locator[1]);
+    }
+    var result = document.evaluate(locator[1], context, null,
+                                   XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var nodes = [];
+    for (var i = 0; i < result.snapshotLength; i++) {
+        nodes.push(result.snapshotItem(i));
+    }
+    return nodes;
+}
+"""
+
+# Tags that start a line of text and tags whose content is not text, for
+# texts computed from the markup.
+_BLOCK_TAGS = frozenset(['address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt',
+                         'fieldset', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5',
+                         'h6', 'header', 'hr', 'li', 'nav', 'ol', 'p', 'pre', 'section', 'table',
+                         'tr', 'ul'])
+_SKIPPED_TAGS = frozenset(['head', 'noscript', 'script', 'style', 'template'])
+
+# The text of an element with its whitespace normalized like WebElement.text
+# and the value of an attribute or, like get_attribute, of a dom property.
+# Hidden elements, and every element in browsers without innerText, have
+# their text computed from the markup like in Snapshot instead: whitespace
+# collapses, br and block elements break lines and scripts are left out.
+_TEXT_FUNCTIONS = """
+var blockTags = /^(%s)$/i, skippedTags = /^(%s)$/i;
+
+function markupText(node, parts) {
+    for (var child = node.firstChild; child; child = child.nextSibling) {
+        if (child.nodeType == 3) {
+            parts.push(child.nodeValue.replace(/[\\s\\u00a0]+/g, ' '));
+        } else if (child.nodeType == 1 && !skippedTags.test(child.tagName)) {
+            if (/^br$/i.test(child.tagName)) {
+                parts.push('\\n');
+                continue;
+            }
+            var block = blockTags.test(child.tagName);
+            if (block) {
+                parts.push('\\n');
+            }
+            markupText(child, parts);
+            if (block) {
+                parts.push('\\n');
+            }
+        }
+    }
+}
+
+function text(element) {
+    var value = element.innerText, parts = [];
+    if (!value) {
+        markupText(element, parts);
+        value = parts.join('');
+    }
+    var lines = [];
+    var raw = value.split('\\n');
+    for (var i = 0; i < raw.length; i++) {
+        var line = raw[i].replace(/[\\s\\u00a0]+/g, ' ').replace(/^ | $/g, '');
+        if (line) {
+            lines.push(line);
+        }
+    }
+    return lines.join('\\n');
+}
+
+function attribute(element, name) {
+    var value = element[name];
+    if (value === undefined || value === null || typeof value == 'object' || typeof value == 'function') {
+        return element.getAttribute(name);
+    }
+    return value;
+}
+""" % ('|'.join(sorted(_BLOCK_TAGS)), '|'.join(sorted(_SKIPPED_TAGS)))
+
+# Reads the text, attributes and descendant texts of every element matched
+# by a locator in the browser, so a list costs one round trip instead of one
+# per element. Rows are lists because nested objects are not unwrapped into
+# WebElements.
+_READ_ELEMENTS_SCRIPT = _FIND_FUNCTION + _TEXT_FUNCTIONS + """
+var root = arguments[0] || document, locator = arguments[1],
+    attributes = arguments[2], fields = arguments[3];
+
+var elements = find(root, locator), rows = [];
+for (var i = 0; i < elements.length; i++) {
+    var element = elements[i], row = [element, text(element)];
+    for (var j = 0; j < attributes.length; j++) {
+        row.push(attribute(element, attributes[j]));
+    }
+    for (var j = 0; j < fields.length; j++) {
+        var child = find(element, fields[j][0])[0], name = fields[j][1];
+        row.push(child ? (name ? attribute(child, name) : text(child)) : null);
+    }
+    rows.push(row);
+}
+return rows;
+"""
+
+# Reads the text or an attribute of the first element, or of every element,
+# matched by each of a list of locators.
+_READ_FIELDS_SCRIPT = _FIND_FUNCTION + _TEXT_FUNCTIONS + """
+var fields = arguments[0], values = [];
+for (var i = 0; i < fields.length; i++) {
+    var locator = fields[i][0], name = fields[i][1], many = fields[i][2];
+    var elements = find(document, locator), found = [];
+    for (var j = 0; j < elements.length && (many || j < 1); j++) {
+        found.push(name ? attribute(elements[j], name) : text(elements[j]));
+    }
+    values.push(many ? found : (found.length ? found[0] : null));
+}
+return values;
+"""
+
+# Locator strategies the script can evaluate, as css selectors.
+_CSS_EQUIVALENTS = {
+    By.CSS_SELECTOR: '%s',
+    By.ID: '[id="%s"]',
+    By.NAME: '[name="%s"]',
+    By.CLASS_NAME: '.%s',
+    By.TAG_NAME: '%s'}
+
+
+def memoize_per_page_load(method):
+    """
+    Decorates a method without arguments so it returns the same value until
+    the browser loads another page. Use it below @property, and only on
+    methods that send finds: checking for another page costs a
+    getCurrentUrl after every command that may change it, and content that
+    changes without loading a page is not noticed.
+    """
+    name = method.__name__
+
+    def memoized(self):
+        epoch = getattr(self.selenium, 'navigation_epoch', None)
+        memo = self.__dict__.setdefault('_page_load_memo', {})
+        if epoch is not None and name in memo and memo[name][0] == epoch:
+            return memo[name][1]
+        value = method(self)
+        memo[name] = (epoch, value)
+        return value
+    memoized.__name__ = name
+    memoized.__doc__ = method.__doc__
+    return memoized
+
+# every method decorated by memoize_per_page_load runs in this code
+_MEMOIZED_CODE = memoize_per_page_load(lambda self: None).func_code
+
+
+def _memoized_method_name(frame):
+    """
+    Returns the name of the method a frame of a memoize_per_page_load
+    wrapper runs, or None for any other frame.
+    """
+    if frame.f_code is _MEMOIZED_CODE:
+        return frame.f_locals['name']
+    return None
+
+
+class Field(object):
+    """
+    A value read by Page._read_fields: the text of the first element matched
+    by locator or, with attribute, its value. With many, the list of those
+    of every match.
+    """
+
+    def __init__(self, locator, attribute=None, many=False):
+        self.locator = locator
+        self.attribute = attribute
+        self.many = many
+
+    def read(self, element):
+        if self.attribute:
+            return element.get_attribute(self.attribute)
+        return element.text
+
+
+class PageRecord(object):
+    """The read-only values of the fields read by Page._read_fields."""
+
+    def __init__(self, values):
+        self.__dict__.update(values)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('%s is read-only' % type(self).__name__)
+
+    def __repr__(self):
+        return '<%s %r>' % (type(self).__name__, self.__dict__)
 
 
 class Page(object):
@@ -31,31 +222,172 @@ class Page(object):
     @property
     def is_the_current_page(self):
         if self._page_title:
-            WebDriverWait(self.selenium, 10).until(lambda s: self.selenium.title)
+            title = self._wait_for_title()
+        else:
+            title = self.selenium.title
 
-        Assert.equal(self.selenium.title, self._page_title,
-            "Expected page title: %s. Actual page title: %s" % (self._page_title, self.selenium.title))
+        Assert.equal(title, self._page_title,
+            "Expected page title: %s. Actual page title: %s" % (self._page_title, title))
         return True
 
     def get_url_current_page(self):
         return self.selenium.current_url
 
     def is_element_present(self, *locator):
-        self.selenium.implicitly_wait(0)
-        try:
-            self.selenium.find_element(*locator)
-            return True
-        except NoSuchElementException:
-            return False
-        finally:
-            # set back to where you once belonged
-            self.selenium.implicitly_wait(self.testsetup.default_implicit_wait)
+        return self._find_optional_element(locator) is not None
 
     def is_element_visible(self, *locator):
+        element = self._find_optional_element(locator)
         try:
-            return self.selenium.find_element(*locator).is_displayed()
-        except NoSuchElementException, ElementNotVisibleException:
+            return element is not None and element.is_displayed()
+        except ElementNotVisibleException:
             return False
 
+    def _find_optional_element(self, locator, root=None):
+        """
+        Returns the first element matched by locator, or None right away if
+        there is none instead of waiting for the implicit wait to run out.
+        root limits the search to the descendants of an element.
+        """
+        with self.selenium.no_implicit_wait():
+            elements = (root or self.selenium).find_elements(*locator)
+        return elements and elements[0] or None
+
     def return_to_previous_page(self):
         self.selenium.back()
+
+    def _wait_until(self, condition, args=(), timeout=10, static=None):
+        """
+        Waits for a javascript condition to hold and returns its value, see
+        EventWait.
+
+        A driver that runs no javascript, like HttpDriver, has the final
+        page right away, so there the function static is asked once instead
+        and the wait fails at once if it returns a false value.
+        """
+        if not getattr(self.selenium, 'runs_javascript', True):
+            if static is None:
+                from pages.http_driver import BrowserRequired
+                raise BrowserRequired('waiting for: %s' % condition)
+            value = static()
+            if not value:
+                raise TimeoutException('The page does not satisfy: %s' % condition)
+            return value
+        from pages.event_wait import EventWait
+        return EventWait(self.selenium, timeout).until(condition, *args)
+
+    def _wait_for_title(self, timeout=10):
+        return self._wait_until('return document.title;', timeout=timeout,
+                                static=lambda: self.selenium.title)
+
+    def _wait_for_element_present(self, locator, timeout=10):
+        self._wait_until('return first(args[0]) !== null;', [self._script_locator(locator)], timeout,
+                         static=lambda: self.is_element_present(*locator))
+
+    def _wait_for_element_not_present(self, locator, timeout=10):
+        self._wait_until('return first(args[0]) === null;', [self._script_locator(locator)], timeout,
+                         static=lambda: not self.is_element_present(*locator))
+
+    def _wait_for_element_not_visible(self, locator, timeout=10):
+        self._wait_until('var element = first(args[0]); return !element || !isShown(element);',
+                         [self._script_locator(locator)], timeout)
+
+    def snapshot(self):
+        """
+        Returns a context in which elements are read from one copy of the
+        page source, see Driver.snapshot.
+
+            with details_page.snapshot():
+                name = details_page.title
+                version = details_page.version_number
+        """
+        return self.selenium.snapshot()
+
+    def _read_texts(self, *locator):
+        """Returns the text of every element matched by locator."""
+        return [row['text'] for row in self._read_elements(locator)]
+
+    def _read_elements(self, locator, attributes=(), fields=None, root=None):
+        """
+        Returns a dictionary for every element matched by locator, read with
+        a single execute_read_script call.
+
+        Each dictionary holds the 'element', its 'text', the value of each
+        of the given attributes and, for every name: locator in fields, the
+        text of the first matching descendant or None if there is none. A
+        Field in place of the locator reads its attribute instead.
+        Unlike WebElement.text, the text of hidden elements is returned too.
+        root limits the search to the descendants of an element.
+        """
+        fields = dict((name, field if isinstance(field, Field) else Field(field))
+                      for name, field in (fields or {}).items())
+        names = list(fields)
+        if self.selenium.snapshot_active:
+            # the elements are read from the snapshot without a round trip
+            return self._read_elements_one_by_one(locator, attributes, fields, root)
+        locators = [locator] + [fields[name].locator for name in names]
+        if not all(strategy in _CSS_EQUIVALENTS or strategy == By.XPATH for strategy, value in locators):
+            # link text locators have no css equivalent
+            return self._read_elements_one_by_one(locator, attributes, fields, root)
+
+        rows = self.selenium.execute_read_script(
+            _READ_ELEMENTS_SCRIPT, root, self._script_locator(locator),
+            list(attributes),
+            [[self._script_locator(fields[name].locator), fields[name].attribute] for name in names])
+        keys = ['element', 'text'] + list(attributes) + names
+        return [dict(zip(keys, row)) for row in rows]
+
+    def _read_fields(self, fields):
+        """
+        Returns a PageRecord with the value of every name: Field in fields,
+        read with a single execute_read_script call. Fields that match no
+        element are None, or an empty list with many.
+        """
+        names = list(fields)
+        locators = [fields[name].locator for name in names]
+        if (self.selenium.snapshot_active or
+                not all(strategy in _CSS_EQUIVALENTS or strategy == By.XPATH for strategy, value in locators)):
+            return PageRecord(self._read_fields_one_by_one(fields))
+
+        values = self.selenium.execute_read_script(
+            _READ_FIELDS_SCRIPT,
+            [[self._script_locator(fields[name].locator), fields[name].attribute, fields[name].many]
+             for name in names])
+        return PageRecord(zip(names, values))
+
+    def _read_fields_one_by_one(self, fields):
+        values = {}
+        with self.selenium.no_implicit_wait():
+            for name, field in fields.items():
+                elements = self.selenium.find_elements(*field.locator)
+                if not field.many:
+                    elements = elements[:1]
+                found = [field.read(element) for element in elements]
+                if field.many:
+                    values[name] = found
+                elif found:
+                    values[name] = found[0]
+                else:
+                    values[name] = None
+        return values
+
+    def _read_elements_one_by_one(self, locator, attributes, fields, root):
+        elements = (root or self.selenium).find_elements(*locator)
+        data = []
+        for element in elements:
+            values = {'element': element, 'text': element.text}
+            for name in attributes:
+                values[name] = element.get_attribute(name)
+            for name, field in fields.items():
+                children = element.find_elements(*field.locator)
+                values[name] = None
+                if children:
+                    values[name] = field.read(children[0])
+            data.append(values)
+        return data
+
+    def _script_locator(self, locator):
+        strategy, value = locator
+        if strategy == By.XPATH:
+            return ['xpath', value]
+        return ['css', _CSS_EQUIVALENTS[strategy] % value]
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import Queue
+import sys
+import threading
+
+_END = object()
+
+
+class _Failure(object):
+
+    def __init__(self, exc_info):
+        self.exc_info = exc_info
+
+
+def prefetch_pages(fetch_page, max_pages=2, key=None):
+    """
+    Yields the items of consecutive pages, fetching ahead in the background.
+
+    fetch_page(page_number) is called with 1, 2, 3... from a separate thread
+    and returns a tuple of (list of items, has_more). While the caller works
+    through one page the following ones are fetched, but no more than
+    max_pages of them wait to be consumed, so besides the page in use and
+    the one being fetched at most max_pages pages are held in memory.
+
+    With key, key(item) identifies an item and the pages stop at the first
+    page that starts with the same item as an earlier one: a server that
+    does not page answers every page number with the first page.
+
+    An exception raised by fetch_page is raised again in the caller once the
+    pages before it were consumed.
+    """
+    pages = Queue.Queue(max_pages)
+    stopped = threading.Event()
+
+    def put(value):
+        # give up when the caller stopped iterating instead of blocking forever
+        while not stopped.isSet():
+            try:
+                pages.put(value, timeout=0.1)
+                return True
+            except Queue.Full:
+                pass
+        return False
+
+    def fetch():
+        page_number = 1
+        first_keys = set()
+        try:
+            while True:
+                items, has_more = fetch_page(page_number)
+                if key is not None and items:
+                    if key(items[0]) in first_keys:
+                        break
+                    first_keys.add(key(items[0]))
+                if not put(items) or not has_more:
+                    break
+                page_number += 1
+        except Exception:
+            put(_Failure(sys.exc_info()))
+        put(_END)
+
+    fetcher = threading.Thread(target=fetch)
+    fetcher.daemon = True
+    fetcher.start()
+    try:
+        while True:
+            page = pages.get()
+            if page is _END:
+                return
+            if isinstance(page, _Failure):
+                raise page.exc_info[0], page.exc_info[1], page.exc_info[2]
+            for item in page:
+                yield item
+    finally:
+        stopped.set()
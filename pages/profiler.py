@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import json
+import sys
+import threading
+import time
+
+from pages.driver import hook_commands
+from pages.page import Page, _memoized_method_name
+
+
+class CommandProfiler(object):
+    """
+    Counts and times every WebDriver command.
+
+    Each command is added up per command name, per test and per page object
+    method that issued it. The method is the outermost page object frame on
+    the stack, so a command sent by a helper is charged to the property or
+    method the test called, like Details.title. Properties decorated with
+    memoize_per_page_load are charged under their own name.
+    """
+
+    def __init__(self):
+        self.current_test = None
+        self.commands = {}
+        self.tests = {}
+        self.methods = {}
+        self._lock = threading.Lock()
+
+    def instrument(self, selenium):
+        """Routes the commands of a WebDriver through this profiler."""
+        def profile(execute, driver_command, params):
+            start = time.time()
+            try:
+                return execute(driver_command, params)
+            finally:
+                self.record(driver_command, time.time() - start, _issuing_method())
+
+        hook_commands(selenium, 'profiler', profile)
+
+    def record(self, command, seconds, method=None):
+        self._lock.acquire()
+        try:
+            _add(self.commands, command, 1, seconds)
+            _add(self.tests, self.current_test or '<no test>', 1, seconds)
+            _add(self.methods, method or '<test code>', 1, seconds)
+        finally:
+            self._lock.release()
+
+    def as_dict(self):
+        return {'commands': self.commands, 'tests': self.tests, 'methods': self.methods}
+
+    def merge(self, profile):
+        """Adds a profile returned by as_dict, for example from an xdist worker."""
+        for table in ('commands', 'tests', 'methods'):
+            for key, (count, seconds) in profile[table].items():
+                _add(getattr(self, table), key, count, seconds)
+
+    def save(self, path):
+        profile_file = open(path, 'w')
+        try:
+            json.dump(self.as_dict(), profile_file, indent=2, sort_keys=True)
+        finally:
+            profile_file.close()
+
+    def report(self, top=10):
+        """Returns the lines of a report of the most expensive methods and tests."""
+        total_count = sum([count for count, seconds in self.commands.values()])
+        total_seconds = sum([seconds for count, seconds in self.commands.values()])
+        lines = ['%d WebDriver commands in %.2fs' % (total_count, total_seconds)]
+        for title, table in (('page object methods', self.methods),
+                             ('tests', self.tests),
+                             ('commands', self.commands)):
+            lines.append('')
+            lines.append('top %d %s by WebDriver time:' % (top, title))
+            ranked = sorted(table.items(), key=lambda item: item[1][1], reverse=True)
+            for name, (count, seconds) in ranked[:top]:
+                lines.append('%10.2fs %7d  %s' % (seconds, count, name))
+        return lines
+
+
+def _add(table, key, count, seconds):
+    totals = table.setdefault(key, [0, 0.0])
+    totals[0] += count
+    totals[1] += seconds
+
+
+def _issuing_method():
+    method = None
+    frame = sys._getframe(2)
+    while frame is not None:
+        page = frame.f_locals.get('self')
+        if isinstance(page, Page) and frame.f_code.co_name != '<lambda>':
+            method = '%s.%s' % (type(page).__name__, _memoized_method_name(frame) or frame.f_code.co_name)
+        frame = frame.f_back
+    return method
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+# Called with null, marks the loaded page and returns its token, or null if
+# the browser cannot listen to it. Called with a token, tells if the page is
+# still the marked one and no user action has touched it since. Changes the
+# page's own scripts make are not user actions and keep it shared.
+_GUARD_SCRIPT = """
+var token = arguments[0], state = window.__addonTestsShared;
+if (token) {
+    return !!state && state.token == token && !state.touched &&
+           window.pageXOffset == state.x && window.pageYOffset == state.y;
+}
+if (!document.addEventListener) {
+    return null;
+}
+state = window.__addonTestsShared = {
+    token: String(Math.random()).slice(2), touched: false,
+    x: window.pageXOffset, y: window.pageYOffset};
+function touch() {
+    state.touched = true;
+}
+var events = ['click', 'mousedown', 'mouseover', 'keydown', 'input', 'change', 'submit', 'focus'];
+for (var i = 0; i < events.length; i++) {
+    document.addEventListener(events[i], touch, true);
+}
+return state.token;
+"""
+
+
+class SharedPages(object):
+    """
+    Opens pages for tests that only read them, reusing the page the browser
+    already shows if an earlier test opened the same url and left it as it
+    was.
+
+    A page counts as touched once a test clicked, typed, hovered, focused,
+    scrolled or navigated away. Touched pages are loaded again. Changes a
+    test makes with execute_script go unnoticed, so tests doing that open
+    their pages without sharing.
+    """
+
+    def __init__(self):
+        self._tokens = {}
+
+    def open(self, selenium, url):
+        if not getattr(selenium, 'runs_javascript', True):
+            selenium.get(url)
+            return
+        # the guard only reads or marks the page, so memoized properties and
+        # cached elements of a reused page stay valid
+        token = self._tokens.get(url)
+        if token and selenium.execute_read_script(_GUARD_SCRIPT, token):
+            return
+        selenium.get(url)
+        self._tokens[url] = selenium.execute_read_script(_GUARD_SCRIPT, None)
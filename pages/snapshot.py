@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import re
+import urlparse
+
+from lxml import html
+from lxml.cssselect import CSSSelector, ExpressionError, SelectorSyntaxError
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from pages.page import _BLOCK_TAGS, _CSS_EQUIVALENTS, _SKIPPED_TAGS
+
+_BOOLEAN_ATTRIBUTES = frozenset(['checked', 'disabled', 'multiple', 'readonly', 'required', 'selected'])
+_URL_ATTRIBUTES = frozenset(['action', 'href', 'src'])
+_WHITESPACE = re.compile(u'[\\s\\xa0]+', re.UNICODE)
+_HIDDEN_STYLE = re.compile(r'display\s*:\s*none|visibility\s*:\s*hidden')
+
+
+class Snapshot(object):
+    """
+    A parsed copy of the page source that answers find_element(s) locally.
+
+    Elements found in a snapshot read their text, tag name and attributes
+    from the copy. Everything else, like click or is_displayed, is passed to
+    the live element, which is looked up by its path the first time it is
+    needed. Locators that lxml cannot evaluate are looked up live as well.
+
+    Text is computed from the markup, so only elements hidden with an inline
+    style or the hidden attribute are left out of it.
+    """
+
+    _selectors = {}
+
+    def __init__(self, selenium, page_source):
+        self.selenium = selenium
+        if isinstance(page_source, unicode):
+            page_source = page_source.encode('utf-8')
+        self.tree = html.fromstring(page_source, parser=html.HTMLParser(encoding='utf-8'))
+        self._current_url = None
+
+    @property
+    def current_url(self):
+        if self._current_url is None:
+            self._current_url = self.selenium.current_url
+        return self._current_url
+
+    def find_element(self, by=By.ID, value=None, context=None):
+        elements = self.find_elements(by, value, context)
+        if not elements:
+            raise NoSuchElementException('Unable to locate element: {"method":"%s","selector":"%s"}' % (by, value))
+        return elements[0]
+
+    def find_elements(self, by=By.ID, value=None, context=None):
+        if context is None:
+            nodes = self._evaluate(by, value, self.tree)
+        else:
+            nodes = self._evaluate(by, value, context.node)
+        if nodes is not None:
+            return [self._element(node) for node in nodes]
+        return self._find_live_elements(by, value, context)
+
+    def _element(self, node):
+        return SnapshotElement(self, node)
+
+    def _find_live_elements(self, by, value, context):
+        if context is None:
+            return self.selenium.find_elements(by, value)
+        return context.live_element.find_elements(by, value)
+
+    def _evaluate(self, by, value, node):
+        if by == By.XPATH:
+            return [match for match in node.xpath(value) if isinstance(match, html.HtmlElement)]
+        if by in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+            links = [(link, _text(link)) for link in node.iterdescendants('a')]
+            if by == By.LINK_TEXT:
+                return [link for link, text in links if text == value]
+            return [link for link, text in links if value in text]
+        if by not in _CSS_EQUIVALENTS:
+            return None
+        selector = self._selector(_CSS_EQUIVALENTS[by] % value)
+        if selector is None:
+            return None
+        return selector(node)
+
+    def _selector(self, css):
+        if css not in self._selectors:
+            try:
+                self._selectors[css] = CSSSelector(css, translator='html')
+            except (ExpressionError, SelectorSyntaxError):
+                # pseudo classes like :visible only exist in the browser
+                self._selectors[css] = None
+        return self._selectors[css]
+
+
+class SnapshotElement(object):
+    """An element of a Snapshot, standing in for a WebElement."""
+
+    def __init__(self, snapshot, node):
+        self._snapshot = snapshot
+        self.node = node
+        self._live_element = None
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.live_element, name)
+
+    @property
+    def live_element(self):
+        if self._live_element is None:
+            path = self.node.getroottree().getpath(self.node)
+            self._live_element = self._snapshot.selenium.find_element(By.XPATH, path)
+        return self._live_element
+
+    @property
+    def text(self):
+        return _text(self.node)
+
+    @property
+    def tag_name(self):
+        return self.node.tag.lower()
+
+    def get_attribute(self, name):
+        if name in _BOOLEAN_ATTRIBUTES:
+            return name in self.node.attrib and u'true' or None
+        if name in ('class', 'className'):
+            return self.node.get('class')
+        value = self.node.get(name)
+        if value is None:
+            if name.lower() != name:
+                # a dom property like textContent or naturalWidth
+                return self.live_element.get_attribute(name)
+            return None
+        if name in _URL_ATTRIBUTES:
+            return urlparse.urljoin(self._snapshot.current_url, value)
+        return value
+
+    def find_element(self, by=By.ID, value=None):
+        return self._snapshot.find_element(by, value, self)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self._snapshot.find_elements(by, value, self)
+
+
+def _text(node):
+    parts = []
+    _append_text(node, parts)
+    lines = [line.strip() for line in u''.join(parts).split(u'\n')]
+    return u'\n'.join([line for line in lines if line])
+
+
+def _append_text(node, parts):
+    tag = node.tag.lower()
+    if tag == 'br':
+        parts.append(u'\n')
+        return
+    block = tag in _BLOCK_TAGS
+    if block:
+        parts.append(u'\n')
+    # whitespace in the markup collapses, line breaks come from the tags
+    if node.text:
+        parts.append(_WHITESPACE.sub(u' ', node.text))
+    for child in node:
+        if isinstance(child.tag, basestring) and not _is_hidden(child):
+            _append_text(child, parts)
+        if child.tail:
+            parts.append(_WHITESPACE.sub(u' ', child.tail))
+    if block:
+        parts.append(u'\n')
+
+
+def _is_hidden(node):
+    return (node.tag.lower() in _SKIPPED_TAGS or
+            'hidden' in node.attrib or
+            _HIDDEN_STYLE.search(node.get('style', '')) is not None or
+            node.get('type') == 'hidden')
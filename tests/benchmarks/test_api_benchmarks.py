@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+'''
+Benchmarks of the api page object against synthetic search documents.
+
+They only run with --benchmark. The search document of every catalog size
+is rendered to a file by one child process and parsed by another that does
+nothing else, so its peak memory is that of the api page object alone.
+The results are compared with the JSON baseline given by
+--benchmark-baseline. A metric that is worse than its baseline by more
+than --benchmark-threshold fails the test. Times are the best of several
+runs that each repeat the measured code for at least MIN_TIMING_SECONDS,
+and the getters are timed together over a batch of names, so the
+comparison is not thrown off by timer resolution.
+
+Timings depend on the machine, so no baseline is kept in the repository.
+Create one on the machine the benchmarks run on with
+
+    py.test --benchmark --benchmark-save tests/benchmarks
+
+until then, the benchmarks are skipped.
+'''
+
+import json
+import multiprocessing
+import os
+import Queue
+import random
+import time
+import timeit
+
+import pytest
+
+from unittestzero import Assert
+
+from pages.desktop.addons_api import AddOnsAPI
+from tests.fake_amo_api import render_search_document, synthetic_catalog
+
+SIZES = [100, 1000, 10000, 100000]
+
+# seconds a child process may take to render or measure one catalog
+CHILD_TIMEOUT = 1800
+
+GETTERS = ['get_addon_type_name', 'get_addon_status', 'get_addon_version_number',
+           'get_addon_description', 'get_addon_summary', 'get_list_of_addon_author_names',
+           'get_list_of_addon_images_links', 'get_icon_url', 'get_compatible_applications',
+           'get_total_downloads', 'get_devs_comments', 'get_reviews_count', 'get_install_link',
+           'get_addon_record']
+
+# metrics where a bigger number is better, all others are times and sizes
+HIGHER_IS_BETTER = ['strip_links_per_second']
+
+# a timing repeats its function until it ran for at least this many seconds
+MIN_TIMING_SECONDS = 0.2
+
+# differences to the baseline within these absolute amounts are never
+# regressions, the peak rss delta of a small catalog is close to 0
+ABSOLUTE_TOLERANCE = {'peak_rss_kb': 1024}
+
+
+def pytest_funcarg__benchmark_options(request):
+    return request.config.option
+
+
+def pytest_generate_tests(metafunc):
+    if 'catalog_size' in metafunc.funcargnames:
+        for size in SIZES:
+            metafunc.addcall(funcargs={'catalog_size': size}, id=str(size))
+
+
+class _FileClient(object):
+
+    def __init__(self, path):
+        self.path = path
+
+    def get(self, url):
+        document_file = open(self.path, 'rb')
+        try:
+            return document_file.read()
+        finally:
+            document_file.close()
+
+
+class _TestSetup(object):
+
+    api_base_url = 'http://benchmark'
+    base_url = 'http://benchmark'
+    selenium = None
+    timeout = 60
+
+
+def _peak_rss_kb():
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports kilobytes, mac os x bytes
+    if os.uname()[0] == 'Darwin':
+        peak /= 1024
+    return peak
+
+
+def _best_of(repeat, function):
+    """
+    Returns the seconds of one call of function, the best of repeat timings
+    that each call it as often as it takes to run for MIN_TIMING_SECONDS.
+    """
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= MIN_TIMING_SECONDS:
+            break
+        number *= 2
+    best = min([elapsed] + timer.repeat(repeat - 1, number))
+    return best / number
+
+
+def render(catalog_size, path):
+    """Writes the search document of a synthetic catalog to path."""
+    document_file = open(path, 'wb')
+    try:
+        document_file.write(render_search_document(synthetic_catalog(catalog_size)))
+    finally:
+        document_file.close()
+
+
+def measure(path, catalog_size):
+    """Returns a dictionary of the metrics of the search document at path."""
+    AddOnsAPI.http_client = _FileClient(path)
+    testsetup = _TestSetup()
+    results = {}
+
+    rss_before = _peak_rss_kb()
+    AddOnsAPI.cache.clear()
+    api = AddOnsAPI(testsetup, 'benchmark')
+    results['peak_rss_kb'] = _peak_rss_kb() - rss_before
+
+    def construct():
+        AddOnsAPI.cache.clear()
+        AddOnsAPI(testsetup, 'benchmark')
+    results['construct_seconds'] = _best_of(catalog_size < 10000 and 5 or 1, construct)
+
+    # a single getter call takes only a few microseconds, so all getters are
+    # timed together for all names
+    names = [addon.name for addon in random.Random(0).sample(api.addons, min(200, catalog_size))]
+    getters = [getattr(api, getter_name) for getter_name in GETTERS]
+    results['getters_seconds'] = _best_of(5, lambda: [getter(name) for getter in getters for name in names])
+
+    descriptions = [api.get_xml_for_single_addon(name).description for name in names]
+    elapsed = _best_of(5, lambda: [api._strip_links_from_text(text) for text in descriptions])
+    results['strip_links_per_second'] = len(descriptions) / max(elapsed, 1e-9)
+    return results
+
+
+def _call(queue, function, args):
+    queue.put(function(*args))
+
+
+def _run_in_child(function, *args):
+    """Returns function(*args), called in a new process."""
+    queue = multiprocessing.Queue()
+    child = multiprocessing.Process(target=_call, args=(queue, function, args))
+    child.start()
+    deadline = time.time() + CHILD_TIMEOUT
+    result = None
+    received = False
+    # stop waiting as soon as the child died, it never puts a result then
+    while not received and (child.is_alive() or not queue.empty()) and time.time() < deadline:
+        try:
+            result = queue.get(timeout=1)
+            received = True
+        except Queue.Empty:
+            pass
+    if not received:
+        child.terminate()
+    child.join()
+    if not received or child.exitcode != 0:
+        pytest.fail('%s%r failed in the child process, exit code %s' % (function.__name__, args, child.exitcode))
+    return result
+
+
+def _regressions(results, baseline, threshold):
+    regressions = []
+    for metric, value in sorted(results.items()):
+        expected = baseline.get(metric)
+        if expected is None:
+            continue
+        tolerance = ABSOLUTE_TOLERANCE.get(metric, 0)
+        if metric in HIGHER_IS_BETTER:
+            worse = value < expected * (1 - threshold) - tolerance
+        else:
+            worse = value > expected * (1 + threshold) + tolerance
+        if worse:
+            regressions.append('%s: %.6g (baseline %.6g)' % (metric, value, expected))
+    return regressions
+
+
+@pytest.mark.skip_selenium
+@pytest.mark.benchmark
+class TestAPIBenchmarks:
+
+    def test_api_parsing_and_lookup(self, benchmark_options, catalog_size, tmpdir):
+        path = str(tmpdir.join('search.xml'))
+        _run_in_child(render, catalog_size, path)
+        results = _run_in_child(measure, path, catalog_size)
+
+        baseline_path = benchmark_options.benchmark_baseline
+        baselines = {}
+        if os.path.exists(baseline_path):
+            baselines = json.load(open(baseline_path))
+
+        if benchmark_options.benchmark_save:
+            baselines[str(catalog_size)] = results
+            baseline_file = open(baseline_path, 'w')
+            try:
+                json.dump(baselines, baseline_file, indent=2, sort_keys=True)
+            finally:
+                baseline_file.close()
+            return
+
+        if str(catalog_size) not in baselines:
+            pytest.skip('no baseline for %d addons in %s, create it with --benchmark-save' % (catalog_size, baseline_path))
+        regressions = _regressions(results, baselines[str(catalog_size)],
+                                   benchmark_options.benchmark_threshold)
+        Assert.equal([], regressions,
+                     'Worse than the baseline in %s: %s' % (baseline_path, ', '.join(regressions)))
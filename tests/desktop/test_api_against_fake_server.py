@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import time
+
+import pytest
+
+from unittestzero import Assert
+
+from pages.desktop.addons_api import AddOnsAPI
+from pages.http_client import Cassette, HttpClient, RecordingClient, ReplayClient
+from pages.http_driver import HttpDriver
+from tests.fake_amo_api import FakeAMOAPIServer, WORDS
+
+#These tests run the api page object against a local fake of the search api.
+#There should be no tests requiring selenium or the network in this class.
+
+
+@pytest.mark.skip_selenium
+class TestAPIAgainstFakeServer:
+
+    def test_that_every_addon_of_a_large_catalog_is_parsed(self, mozwebqa, amo_api_server):
+        amo_api_server.catalog_size = 5000
+        mozwebqa.api_base_url = amo_api_server.url
+
+        addons_xml = AddOnsAPI(mozwebqa, 'addon')
+        Assert.equal(4999, len(addons_xml.addons))
+        last_addon = addons_xml.addons[-1]
+        Assert.true(last_addon.slug.endswith('-addon-04999'))
+        Assert.not_none(addons_xml.get_addon_record(last_addon.name)['install'])
+
+    def test_that_a_search_is_only_fetched_once(self, mozwebqa, amo_api_server):
+        mozwebqa.api_base_url = amo_api_server.url
+
+        first = AddOnsAPI(mozwebqa)
+        second = AddOnsAPI(mozwebqa)
+        Assert.equal("Firebug", first.get_name_of_first_addon())
+        Assert.equal(first.get_addon_record("Firebug"), second.get_addon_record("firebug"))
+        Assert.equal(1, len(amo_api_server.requests))
+
+    def test_that_prefetch_runs_searches_concurrently(self, mozwebqa, amo_api_server):
+        amo_api_server.latency = 0.5
+        mozwebqa.api_base_url = amo_api_server.url
+
+        start = time.time()
+        Assert.equal({}, AddOnsAPI.prefetch(mozwebqa, WORDS, concurrency=len(WORDS)))
+        Assert.less(time.time() - start, amo_api_server.latency * len(WORDS) / 2)
+
+        for word in WORDS:
+            AddOnsAPI(mozwebqa, word)
+        Assert.equal(len(WORDS), len(amo_api_server.requests))
+
+    def test_that_iter_addons_walks_every_page_of_a_search(self, mozwebqa, amo_api_server):
+        amo_api_server.catalog_size = 1000
+        mozwebqa.api_base_url = amo_api_server.url
+
+        slugs = [addon.slug for addon in AddOnsAPI.iter_addons(mozwebqa, 'addon', page_size=100)]
+        Assert.equal(999, len(slugs))
+        Assert.equal(999, len(set(slugs)))
+        Assert.equal(10, len(amo_api_server.requests))
+
+    def test_that_a_recorded_search_replays_without_the_server(self, mozwebqa, tmpdir):
+        # a server of its own, the one of amo_api_server lives for the session
+        server = FakeAMOAPIServer().start()
+        mozwebqa.api_base_url = server.url
+        cassette_path = str(tmpdir.join('api.json.gz'))
+        http_client = AddOnsAPI.http_client
+        try:
+            AddOnsAPI.http_client = RecordingClient(Cassette(cassette_path))
+            recorded = AddOnsAPI(mozwebqa).get_addon_record('Firebug')
+            AddOnsAPI.http_client.close()
+            server.stop()
+
+            AddOnsAPI.cache.clear()
+            AddOnsAPI.http_client = ReplayClient(Cassette(cassette_path))
+            Assert.equal(recorded, AddOnsAPI(mozwebqa).get_addon_record('Firebug'))
+            search_url = AddOnsAPI._search_url(server.url, 'firebug')
+            Assert.equal((search_url, AddOnsAPI.http_client.get(search_url)),
+                         AddOnsAPI.http_client.fetch(search_url))
+        finally:
+            AddOnsAPI.http_client = http_client
+            AddOnsAPI.cache.clear()
+
+    def test_that_the_http_driver_shows_error_pages_like_a_browser(self, amo_api_server):
+        http_client = HttpClient()
+        try:
+            selenium = HttpDriver(http_client)
+            selenium.get('%s/missing' % amo_api_server.url)
+            Assert.equal('Not Found', selenium.title)
+            Assert.equal('Page not found', selenium.find_element('css selector', 'h1').text)
+            Assert.equal('%s/missing' % amo_api_server.url, selenium.current_url)
+        finally:
+            http_client.close()
@@ -52,3 +52,13 @@ class TestAPIOnlyTests:
         """Test for Litmus 15327."""
         addon_xml = AddOnsAPI(mozwebqa)
         Assert.contains("fx.xpi?src=api", addon_xml.get_install_link("Firebug"))
+
+    def test_that_firebug_addon_record_matches_the_single_field_getters(self, mozwebqa):
+        addon_xml = AddOnsAPI(mozwebqa)
+        record = addon_xml.get_addon_record("Firebug")
+        Assert.equal("Firebug", record['name'])
+        Assert.equal(addon_xml.get_addon_version_number("Firebug"), record['version'])
+        Assert.equal(addon_xml.get_list_of_addon_author_names("Firebug"), record['authors'])
+        Assert.equal(addon_xml.get_list_of_addon_images_links("Firebug"), record['previews'])
+        Assert.equal(addon_xml.get_compatible_applications("Firebug"), record['compatibility'])
+        Assert.equal(addon_xml.get_daily_users("Firebug"), record['daily_users'])
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import pytest
+
+from unittestzero import Assert
+
+from pages.browser_pool import BrowserPool
+
+#These tests run the browser pool against fake browsers.
+#There should be no tests requiring selenium or the network in this class.
+
+
+class FakeBrowser(object):
+
+    def __init__(self, current_url, window_handles=('main',)):
+        self.current_url = current_url
+        self.window_handles = list(window_handles)
+        self.current_window = self.window_handles[0]
+        self.calls = []
+        self.broken = False
+
+    def _call(self, *call):
+        if self.broken:
+            raise Exception('the browser is gone')
+        self.calls.append(call)
+
+    def switch_to_window(self, handle):
+        self._call('switch_to_window', handle)
+        self.current_window = handle
+
+    def close(self):
+        self._call('close', self.current_window)
+        self.window_handles.remove(self.current_window)
+
+    def get(self, url):
+        self._call('get', url)
+        self.current_url = url
+
+    def delete_all_cookies(self):
+        self._call('delete_all_cookies')
+
+    def execute_script(self, script, *args):
+        self._call('execute_script')
+
+    def implicitly_wait(self, time_to_wait):
+        self._call('implicitly_wait', time_to_wait)
+
+    def quit(self):
+        self.calls.append(('quit',))
+
+
+@pytest.mark.skip_selenium
+class TestBrowserPool:
+
+    def test_that_reset_closes_extra_windows_and_clears_the_site(self):
+        pool = BrowserPool('https://addons.example.com')
+        browser = FakeBrowser('https://addons.example.com/en-US/firefox/', ['main', 'popup', 'paypal'])
+
+        pool.reset(browser, 10)
+        Assert.equal(['main'], browser.window_handles)
+        Assert.equal('main', browser.current_window)
+        Assert.equal([('switch_to_window', 'popup'), ('close', 'popup'),
+                      ('switch_to_window', 'paypal'), ('close', 'paypal'),
+                      ('switch_to_window', 'main'),
+                      ('delete_all_cookies',), ('execute_script',), ('implicitly_wait', 10)],
+                     browser.calls)
+
+    def test_that_reset_goes_back_to_the_site_under_test_first(self):
+        pool = BrowserPool('https://addons.example.com')
+        browser = FakeBrowser('https://browserid.example.org/sign_in')
+
+        pool.reset(browser, 10)
+        Assert.equal(('get', 'https://addons.example.com'), browser.calls[1])
+        Assert.equal(('delete_all_cookies',), browser.calls[2])
+
+    def test_that_released_browsers_are_reused_and_broken_ones_quit(self):
+        pool = BrowserPool('https://addons.example.com')
+        Assert.none(pool.acquire())
+
+        browser = FakeBrowser('https://addons.example.com/')
+        pool.release(browser, 10)
+        Assert.true(pool.acquire() is browser)
+        Assert.none(pool.acquire())
+
+        browser.broken = True
+        pool.release(browser, 10)
+        Assert.none(pool.acquire())
+        Assert.equal(('quit',), browser.calls[-1])
+
+        idle = FakeBrowser('https://addons.example.com/')
+        pool.release(idle, 10)
+        pool.close()
+        Assert.equal(('quit',), idle.calls[-1])
+        Assert.none(pool.acquire())
@@ -12,10 +12,12 @@ from pages.desktop.home import Home
 
 
 nondestructive = pytest.mark.nondestructive
+browser = pytest.mark.browser
 
 
 class TestCategory:
 
+    @browser
     @nondestructive
     def test_that_all_category_links_work(self, mozwebqa):
         """Test for Litmus 25796."""
@@ -51,11 +53,12 @@ class TestCategory:
 
         # Get actual categories
         home_page = Home(mozwebqa)
-        categories = home_page.categories
+        with home_page.snapshot():
+            categories = home_page.categories
 
-        # Catch extra/missing categories with a simple count check
-        Assert.equal(len(categories), len(expected_categories))
+            # Catch extra/missing categories with a simple count check
+            Assert.equal(len(categories), len(expected_categories))
 
-        # Check the categories that are there against the expected list
-        for category in categories:
-            Assert.contains(category.name, expected_categories)
+            # Check the categories that are there against the expected list
+            for category in categories:
+                Assert.contains(category.name, expected_categories)
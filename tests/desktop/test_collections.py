@@ -12,10 +12,12 @@ from pages.desktop.home import Home
 
 nondestructive = pytest.mark.nondestructive
 destructive = pytest.mark.destructive
+browser = pytest.mark.browser
 
 
 class TestCollections:
 
+    @browser
     @nondestructive
     def test_featured_tab_is_highlighted_by_default(self, mozwebqa):
         """
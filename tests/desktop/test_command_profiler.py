@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import json
+
+import pytest
+
+from unittestzero import Assert
+
+from pages.driver import Driver
+from pages.page import Page, memoize_per_page_load
+from pages.profiler import CommandProfiler
+
+#These tests run the command profiler against a fake WebDriver.
+#There should be no tests requiring selenium or the network in this class.
+
+
+class FakeWebDriver(object):
+
+    def __init__(self):
+        self.commands = []
+
+    def execute(self, driver_command, params=None):
+        self.commands.append(driver_command)
+        return {'value': None}
+
+    @property
+    def current_url(self):
+        self.execute('getCurrentUrl')
+        return 'http://example.com/'
+
+    def find_element(self, by, value):
+        self.execute('findElement', {'using': by, 'value': value})
+        return None
+
+
+class FakeTestSetup(object):
+
+    base_url = 'http://example.com'
+    api_base_url = 'http://example.com'
+    timeout = 10
+
+    def __init__(self, selenium):
+        self.selenium = selenium
+
+
+class FakePage(Page):
+
+    @property
+    @memoize_per_page_load
+    def header(self):
+        return self._find_header()
+
+    @property
+    def title(self):
+        return self._find_header()
+
+    def _find_header(self):
+        return self.selenium.find_element('id', 'header')
+
+
+@pytest.mark.skip_selenium
+class TestCommandProfiler:
+
+    def test_that_memoized_properties_are_charged_under_their_own_name(self):
+        selenium = FakeWebDriver()
+        profiler = CommandProfiler()
+        profiler.instrument(selenium)
+        page = FakePage(FakeTestSetup(Driver(selenium, 10)))
+
+        page.header
+        Assert.contains('getCurrentUrl', selenium.commands)
+        Assert.contains('findElement', selenium.commands)
+        # the url is asked for by the wrapper, the lookup by the property
+        Assert.equal(['FakePage.header'], profiler.methods.keys())
+        Assert.equal(len(selenium.commands), profiler.methods['FakePage.header'][0])
+
+    def test_that_commands_are_charged_to_the_outermost_page_method(self):
+        selenium = FakeWebDriver()
+        profiler = CommandProfiler()
+        profiler.instrument(selenium)
+        profiler.instrument(selenium)
+        profiler.current_test = 'TestFake::test_title'
+        page = FakePage(FakeTestSetup(selenium))
+
+        page.title
+        page.title
+        selenium.find_element('id', 'footer')
+        Assert.equal(3, len(selenium.commands))
+        Assert.equal(2, profiler.methods['FakePage.title'][0])
+        Assert.equal(1, profiler.methods['<test code>'][0])
+        Assert.equal(3, profiler.commands['findElement'][0])
+        Assert.equal(['TestFake::test_title'], profiler.tests.keys())
+
+    def test_that_profiles_merge_and_report_the_most_expensive_first(self, tmpdir):
+        profiler = CommandProfiler()
+        profiler.current_test = 'TestFake::test_one'
+        profiler.record('findElement', 1.0, 'FakePage.title')
+        profiler.record('getElementText', 0.5, 'FakePage.header')
+        worker = CommandProfiler()
+        worker.current_test = 'TestFake::test_two'
+        worker.record('findElement', 2.0, 'FakePage.header')
+        profiler.merge(json.loads(json.dumps(worker.as_dict())))
+
+        Assert.equal([2, 3.0], profiler.commands['findElement'])
+        Assert.equal([2, 2.5], profiler.methods['FakePage.header'])
+        Assert.equal(['3 WebDriver commands in 3.50s',
+                      '',
+                      'top 1 page object methods by WebDriver time:',
+                      '      2.50s       2  FakePage.header',
+                      '',
+                      'top 1 tests by WebDriver time:',
+                      '      2.00s       1  TestFake::test_two',
+                      '',
+                      'top 1 commands by WebDriver time:',
+                      '      3.00s       2  findElement'],
+                     profiler.report(top=1))
+
+        path = str(tmpdir.join('profile.json'))
+        profiler.save(path)
+        Assert.equal(json.loads(json.dumps(profiler.as_dict())), json.load(open(path)))
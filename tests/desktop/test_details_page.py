@@ -15,16 +15,18 @@ from pages.desktop.extensions import ExtensionsHome
 from pages.desktop.home import Home
 
 nondestructive = pytest.mark.nondestructive
+browser = pytest.mark.browser
 
 
 class TestDetails:
 
     @nondestructive
-    def test_that_register_login_link_is_present_in_addon_details_page(self, mozwebqa):
+    def test_that_register_login_link_is_present_in_addon_details_page(self, shared_details):
         """Test for Litmus 9890."""
-        details_page = Details(mozwebqa, "Firebug")
+        details_page = shared_details("Firebug")
         Assert.equal(details_page.register_link, "Log in / Register", "Login / Register text does not match the expected one")
 
+    @browser
     @nondestructive
     def test_that_dropdown_menu_is_present_after_click_on_other_apps(self, mozwebqa):
         """Test for Litmus 9890."""
@@ -34,26 +36,27 @@ class TestDetails:
         Assert.true(details_page.header.is_other_apps_dropdown_menu_visible)
 
     @nondestructive
-    def test_that_addon_name_is_displayed(self, mozwebqa):
+    def test_that_addon_name_is_displayed(self, shared_details):
         """Test for Litmus 9890."""
-        details_page = Details(mozwebqa, "Firebug")
+        details_page = shared_details("Firebug")
         # check that the name is not empty
         Assert.not_none(details_page.title, "")
 
     @nondestructive
-    def test_that_summary_is_displayed(self, mozwebqa):
+    def test_that_summary_is_displayed(self, shared_details):
         """Test for Litmus 9890."""
-        details_page = Details(mozwebqa, "Firebug")
+        details_page = shared_details("Firebug")
         # check that the summary is not empty
         Assert.not_none(re.match('(\w+\s*){3,}', details_page.summary))
 
     @nondestructive
-    def test_that_about_this_addon_is_displayed(self, mozwebqa):
+    def test_that_about_this_addon_is_displayed(self, shared_details):
         """Test for Litmus 9890."""
-        details_page = Details(mozwebqa, "Firebug")
+        details_page = shared_details("Firebug")
         Assert.equal(details_page.about_addon, "About this Add-on")
         Assert.not_none(re.match('(\w+\s*){3,}', details_page.description))
 
+    @browser
     @nondestructive
     def test_that_version_information_is_displayed(self, mozwebqa):
         """Test for Litmus 9890."""
@@ -75,13 +78,14 @@ class TestDetails:
         Assert.equal('Version %s' % details_page.version_number, details_page.release_version)
 
     @nondestructive
-    def test_that_reviews_are_displayed(self, mozwebqa):
+    def test_that_reviews_are_displayed(self, shared_details):
         """Test for Litmus 9890."""
-        details_page = Details(mozwebqa, "Firebug")
+        details_page = shared_details("Firebug")
         Assert.equal(details_page.review_title, "Reviews")
         Assert.true(details_page.has_reviews)
         Assert.not_none(re.search('(\w+\s*){1,}', details_page.review_details))
 
+    @browser
     @nondestructive
     def test_that_in_often_used_with_addons_are_displayed(self, mozwebqa):
         """Test for Litmus 9890."""
@@ -89,6 +93,7 @@ class TestDetails:
         Assert.equal(details_page.often_used_with_header, u"Often used with\u2026")
         Assert.true(details_page.is_often_used_with_list_visible)
 
+    @browser
     @nondestructive
     def test_that_tags_are_displayed(self, mozwebqa):
         """Test for Litmus 9890."""
@@ -96,12 +101,13 @@ class TestDetails:
         Assert.true(details_page.are_tags_visible)
 
     @nondestructive
-    def test_part_of_collections_are_displayed(self, mozwebqa):
+    def test_part_of_collections_are_displayed(self, shared_details):
         """Test for Litmus 9890."""
-        details_page = Details(mozwebqa, "Firebug")
+        details_page = shared_details("Firebug")
         Assert.equal(details_page.part_of_collections_header, 'Part of these Collections')
         Assert.true(len(details_page.part_of_collections) > 0)
 
+    @browser
     @nondestructive
     def test_that_external_link_leads_to_addon_website(self, mozwebqa):
         """
@@ -117,6 +123,7 @@ class TestDetails:
         details_page.click_website_link()
         Assert.true(website_link in details_page.get_url_current_page())
 
+    @browser
     @nondestructive
     def test_that_whats_this_link_for_source_license_links_to_an_answer_in_faq(self, mozwebqa):
         """Test for Litmus 11530."""
@@ -127,29 +134,30 @@ class TestDetails:
         Assert.not_none(re.match('(\w+\s*){3,}', user_faq_page.license_answer))
 
     @nondestructive
-    def test_other_addons_label_when_there_are_multiple_authors(self, mozwebqa):
+    def test_other_addons_label_when_there_are_multiple_authors(self, shared_details):
         """
         Test for Litmus 11926.
         https://litmus.mozilla.org/show_test.cgi?id=11926
         """
         addon_with_multiple_authors = 'firebug'
-        detail_page = Details(mozwebqa, addon_with_multiple_authors)
+        detail_page = shared_details(addon_with_multiple_authors)
 
         Assert.true(len(detail_page.authors) > 1)
         Assert.equal(detail_page.other_addons_by_authors_text, 'Other add-ons by these authors')
 
     @nondestructive
-    def test_other_addons_label_when_there_is_only_one_author(self, mozwebqa):
+    def test_other_addons_label_when_there_is_only_one_author(self, shared_details):
         """
         Test for Litmus 11926.
         https://litmus.mozilla.org/show_test.cgi?id=11926
         """
         addon_with_one_authors = 'F1 by Mozilla Labs'
-        detail_page = Details(mozwebqa, addon_with_one_authors)
+        detail_page = shared_details(addon_with_one_authors)
 
         Assert.equal(len(detail_page.authors), 1)
         Assert.equal(detail_page.other_addons_by_authors_text, "Other add-ons by %s" % detail_page.authors[0])
 
+    @browser
     @nondestructive
     def test_navigating_to_other_addons(self, mozwebqa):
         """
@@ -163,6 +171,7 @@ class TestDetails:
             Assert.contains(name, detail_page.title)
             Details(mozwebqa, 'firebug')
 
+    @browser
     @nondestructive
     def test_open_close_functionality_for_image_viewer(self, mozwebqa):
         """
@@ -178,6 +187,7 @@ class TestDetails:
         image_viewer.close()
         Assert.false(image_viewer.is_visible)
 
+    @browser
     @nondestructive
     def test_navigation_buttons_for_image_viewer(self, mozwebqa):
         """
@@ -186,24 +196,13 @@ class TestDetails:
         """
 
         detail_page = Details(mozwebqa, 'firebug')
-        images_count = detail_page.previewer.image_count
-        image_set_count = detail_page.previewer.image_set_count
-        images_title = []
-        image_link = []
-        for img_set in range(image_set_count):
-            for img_no in range(3):
-                if img_set * 3 + img_no != images_count:
-                    images_title.append(detail_page.previewer.image_title(img_set * 3 + img_no))
-                    image_link.append(detail_page.previewer.image_link(img_set * 3 + img_no))
-
-            detail_page.previewer.next_set()
-
-        for img_set in range(image_set_count):
-            detail_page.previewer.prev_set()
+        previews = detail_page.previewer.previews
+        images_title = [preview.title for preview in previews]
+        image_link = [preview.link for preview in previews]
 
         image_viewer = detail_page.previewer.click_image()
         Assert.true(image_viewer.is_visible)
-        Assert.equal(images_count, image_viewer.images_count)
+        Assert.equal(len(previews), image_viewer.images_count)
 
         for i in range(image_viewer.images_count):
             Assert.true(image_viewer.is_visible)
@@ -239,6 +238,22 @@ class TestDetails:
             else:
                 Assert.false(image_viewer.is_previous_present)
 
+    @browser
+    @nondestructive
+    def test_that_image_viewer_has_an_image_for_every_preview(self, mozwebqa):
+        """
+        Checks that the image viewer opened from the first preview holds the
+        image of every preview of the carousel, in the same order.
+        """
+        detail_page = Details(mozwebqa, 'firebug')
+        previews = detail_page.previewer.previews
+
+        image_viewer = detail_page.previewer.click_image()
+        Assert.true(image_viewer.is_visible)
+        Assert.equal([preview.link.split('/')[8] for preview in previews],
+                     [link.split('/')[8] for link in image_viewer.image_links])
+
+    @browser
     @nondestructive
     def test_that_review_usernames_are_clickable(self, mozwebqa):
         """
@@ -255,16 +270,18 @@ class TestDetails:
             Details(mozwebqa, addon_name)
 
     @nondestructive
-    def test_that_details_page_has_breadcrumb(self, mozwebqa):
+    def test_that_details_page_has_breadcrumb(self, shared_details):
         """
         Test for Litmus 11922.
         https://litmus.mozilla.org/show_test.cgi?id=11922
         """
-        detail_page = Details(mozwebqa, 'firebug')
-        Assert.equal(detail_page.breadcrumbs[0].text, 'Add-ons for Firefox')
-        Assert.equal(detail_page.breadcrumbs[1].text, 'Extensions')
-        Assert.equal(detail_page.breadcrumbs[2].text, 'Firebug')
+        detail_page = shared_details('firebug')
+        with detail_page.snapshot():
+            Assert.equal(detail_page.breadcrumbs[0].text, 'Add-ons for Firefox')
+            Assert.equal(detail_page.breadcrumbs[1].text, 'Extensions')
+            Assert.equal(detail_page.breadcrumbs[2].text, 'Firebug')
 
+    @browser
     @nondestructive
     def test_that_clicking_info_link_slides_down_page_to_version_info(self, mozwebqa):
         """
@@ -277,6 +294,7 @@ class TestDetails:
         Assert.true(details_page.is_version_information_section_expanded)
         Assert.true(details_page.is_version_information_section_in_view)
 
+    @browser
     @nondestructive
     def test_that_breadcrumb_links_in_details_page_work(self, mozwebqa):
         """
@@ -307,6 +325,7 @@ class TestDetails:
 
         Assert.equal(detail_page.breadcrumbs[2].text, 'Firebug')
 
+    @browser
     @nondestructive
     def test_that_add_a_review_button_works(self, mozwebqa):
         """
@@ -325,6 +344,7 @@ class TestDetails:
         review_box = details_page.click_to_write_review()
         Assert.true(review_box.is_review_box_visible)
 
+    @browser
     @nondestructive
     def test_the_developers_comments_section(self, mozwebqa):
         """
@@ -337,6 +357,7 @@ class TestDetails:
         Assert.true(details_page.is_devs_comments_section_expanded())
         Assert.not_none(re.match('(\w+\s*){3,}', details_page.devs_comments_message))
 
+    @browser
     @nondestructive
     def test_that_add_to_collection_flyout_for_anonymous_users(self, mozwebqa):
         """
@@ -348,6 +369,7 @@ class TestDetails:
         Assert.equal(details_page.collection_widget_button, 'Create an Add-ons Account')
         Assert.equal(details_page.collection_widget_login_link, 'log in to your current account')
 
+    @browser
     @nondestructive
     def test_that_the_development_channel_expands(self, mozwebqa):
         """
@@ -363,6 +385,7 @@ class TestDetails:
         details_page.click_development_channel()
         Assert.equal('', details_page.development_channel_content)
 
+    @browser
     @nondestructive
     def test_click_on_other_collections(self, mozwebqa):
         """
@@ -377,6 +400,7 @@ class TestDetails:
             Assert.equal(name, collection_pg.collection_name, "Expected collection name does not match the page header")
             details_pg = Details(mozwebqa, 'Firebug')
 
+    @browser
     @nondestructive
     def test_the_development_channel_section(self, mozwebqa):
         """
@@ -396,17 +420,18 @@ class TestDetails:
         Assert.not_none(re.match('Version \d\.\d.\d(b|a|rc)[0-9]:', details_page.beta_version))
 
     @nondestructive
-    def test_that_license_link_works(self, mozwebqa):
+    def test_that_license_link_works(self, shared_details):
         """
         Test for Litmus 25726.
         https://litmus.mozilla.org/show_test.cgi?searchType=by_id&id=25726
         """
         addon_name = 'Firebug'
-        details_page = Details(mozwebqa, addon_name)
+        details_page = shared_details(addon_name)
         Assert.equal(details_page.license_link_text, 'BSD License')
         license_link = details_page.license_site
         Assert.not_none(license_link)
 
+    @browser
     @nondestructive
     def test_that_clicking_user_reviews_slides_down_page_to_reviews_section(self, mozwebqa):
         """
@@ -15,6 +15,7 @@ from pages.desktop.addons_api import AddOnsAPI
 
 xfail = pytest.mark.xfail
 nondestructive = pytest.mark.nondestructive
+browser = pytest.mark.browser
 
 
 class TestDetailsAgainstXML:
@@ -22,21 +23,21 @@ class TestDetailsAgainstXML:
     firebug = "Firebug"
 
     @nondestructive
-    def test_that_firebug_page_title_is_correct(self, mozwebqa):
-        firebug_page = Details(mozwebqa, self.firebug)
+    def test_that_firebug_page_title_is_correct(self, shared_details):
+        firebug_page = shared_details(self.firebug)
         Assert.true(re.search(self.firebug, firebug_page.page_title) is not None)
 
     @nondestructive
-    def test_that_firebug_version_number_is_correct(self, mozwebqa):
-        firebug_page = Details(mozwebqa, self.firebug)
+    def test_that_firebug_version_number_is_correct(self, shared_details):
+        firebug_page = shared_details(self.firebug)
         Assert.true(len(str(firebug_page.version_number)) > 0)
 
     @nondestructive
-    def test_that_firebug_authors_is_correct(self, mozwebqa):
+    def test_that_firebug_authors_is_correct(self, mozwebqa, shared_details):
         """Test for Litmus 15319."""
 
         #get authors from browser
-        firebug_page = Details(mozwebqa, self.firebug)
+        firebug_page = shared_details(self.firebug)
         browser_authors = firebug_page.authors
 
         #get authors from xml
@@ -51,11 +52,11 @@ class TestDetailsAgainstXML:
             Assert.equal(xml_authors[i], browser_authors[i])
 
     @nondestructive
-    def test_that_firebug_images_is_correct(self, mozwebqa):
+    def test_that_firebug_images_is_correct(self, mozwebqa, shared_details):
         """Test for Litmus 15324."""
 
         #get images links from browser
-        firebug_page = Details(mozwebqa, self.firebug)
+        firebug_page = shared_details(self.firebug)
         images_count = firebug_page.previewer.image_count
         browser_images = []
         for i in range(images_count):
@@ -73,11 +74,11 @@ class TestDetailsAgainstXML:
             Assert.equal(xml_images[i].replace('src=api&amp;', ''), browser_images[i])
 
     @nondestructive
-    def test_that_firebug_summary_is_correct(self, mozwebqa):
+    def test_that_firebug_summary_is_correct(self, mozwebqa, shared_details):
         """Test for Litmus 15320."""
 
         #browser
-        firebug_page = Details(mozwebqa, self.firebug)
+        firebug_page = shared_details(self.firebug)
         browser_summary = firebug_page.summary
 
         #api
@@ -87,15 +88,15 @@ class TestDetailsAgainstXML:
         Assert.equal(xml_summary, browser_summary)
 
     @nondestructive
-    def test_that_firebug_rating_is_correct(self, mozwebqa):
-        firebug_page = Details(mozwebqa, self.firebug)
+    def test_that_firebug_rating_is_correct(self, shared_details):
+        firebug_page = shared_details(self.firebug)
         Assert.equal("5", firebug_page.rating)
 
     @nondestructive
-    def test_that_description_text_is_correct(self, mozwebqa):
+    def test_that_description_text_is_correct(self, mozwebqa, shared_details):
         """Test for Litmus 15321."""
         #browser
-        firebug_page = Details(mozwebqa, self.firebug)
+        firebug_page = shared_details(self.firebug)
         browser_description = firebug_page.description
 
         #api
@@ -120,11 +121,11 @@ class TestDetailsAgainstXML:
         Assert.equal(browser_icon, xml_icon)
 
     @nondestructive
-    def test_that_support_url_is_correct(self, mozwebqa):
+    def test_that_support_url_is_correct(self, mozwebqa, shared_details):
         """Test for Litmus 15337."""
 
         #browser
-        firebug_page = Details(mozwebqa, self.firebug)
+        firebug_page = shared_details(self.firebug)
         browser_support_url = firebug_page.support_url
 
         #api
@@ -134,11 +135,11 @@ class TestDetailsAgainstXML:
         Assert.equal(browser_support_url, xml_support_url)
 
     @nondestructive
-    def test_that_rating_in_api_equals_rating_in_details_page(self, mozwebqa):
+    def test_that_rating_in_api_equals_rating_in_details_page(self, mozwebqa, shared_details):
         """Test for Litmus 15325."""
 
         #browser
-        firebug_page = Details(mozwebqa, self.firebug)
+        firebug_page = shared_details(self.firebug)
         browser_rating = firebug_page.rating
 
         #api
@@ -147,6 +148,7 @@ class TestDetailsAgainstXML:
 
         Assert.equal(browser_rating, xml_rating)
 
+    @browser
     @nondestructive
     def test_that_compatible_applications_equal(self, mozwebqa):
         """Test for Litmus 15323."""
@@ -194,6 +196,7 @@ class TestDetailsAgainstXML:
 
         Assert.not_none(re.search(self.firebug, initial_page.page_title))
 
+    @browser
     @nondestructive
     def test_that_firebug_devs_comments_is_correct(self, mozwebqa):
         """Test for Litmus 15329."""
@@ -210,11 +213,11 @@ class TestDetailsAgainstXML:
         Assert.equal(xml_devs_comments, browser_devs_comments)
 
     @nondestructive
-    def test_that_home_page_in_api_equals_home_page_in_details_page(self, mozwebqa):
+    def test_that_home_page_in_api_equals_home_page_in_details_page(self, mozwebqa, shared_details):
         """Test for Litmus 15336."""
 
         #browser
-        firebug_page = Details(mozwebqa, self.firebug)
+        firebug_page = shared_details(self.firebug)
         browser_home_page = urlparse.unquote(firebug_page.website)
 
         #api
@@ -224,11 +227,11 @@ class TestDetailsAgainstXML:
         Assert.contains(xml_home_page, browser_home_page)
 
     @nondestructive
-    def test_that_reviews_in_api_equals_reviews_in_details_page(self, mozwebqa):
+    def test_that_reviews_in_api_equals_reviews_in_details_page(self, mozwebqa, shared_details):
         """Test for Litmus 15330."""
 
         #browser
-        firebug_page = Details(mozwebqa, self.firebug)
+        firebug_page = shared_details(self.firebug)
         browser_reviews = firebug_page.total_reviews_count
 
         #api
@@ -238,11 +241,11 @@ class TestDetailsAgainstXML:
         Assert.equal(browser_reviews, xml_reviews)
 
     @nondestructive
-    def test_that_daily_users_in_api_equals_daily_users_in_details_page(self, mozwebqa):
+    def test_that_daily_users_in_api_equals_daily_users_in_details_page(self, mozwebqa, shared_details):
         """Test for Litmus 15333."""
 
         #browser
-        firebug_page = Details(mozwebqa, self.firebug)
+        firebug_page = shared_details(self.firebug)
         browser_daily_users = firebug_page.daily_users_number
 
         #api
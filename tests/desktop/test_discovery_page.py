@@ -14,6 +14,7 @@ from pages.desktop.discovery import DiscoveryPane
 from pages.desktop.home import Home
 
 nondestructive = pytest.mark.nondestructive
+browser = pytest.mark.browser
 
 
 class TestDiscoveryPane:
@@ -22,6 +23,7 @@ class TestDiscoveryPane:
     #Need to get this info before run
     basepath = '/en-US/firefox/discovery/pane/4.0/Darwin'
 
+    @browser
     @nondestructive
     def test_that_users_with_less_than_3_addons_get_what_are_addons(self, mozwebqa):
         """
@@ -37,6 +39,7 @@ class TestDiscoveryPane:
 
         Assert.equal(what_are_addons_expected, discovery_pane.what_are_addons_text)
 
+    @browser
     @nondestructive
     def test_that_mission_statement_is_on_addons_home_page(self, mozwebqa):
         """Test for Litmus 15065."""
@@ -49,6 +52,7 @@ class TestDiscoveryPane:
         download_count_regex = "Add-ons downloaded: (.+)"
         Assert.true(re.search(download_count_regex, discovery_pane.download_count) != None)
 
+    @browser
     @nondestructive
     def test_that_featured_personas_is_present_and_has_5_item(self, mozwebqa):
         """Test for Litmus 15079, 15080."""
@@ -66,6 +70,7 @@ class TestDiscoveryPane:
         persona = discovery_pane.click_on_first_persona()
         Assert.equal(first_persona, persona.persona_title)
 
+    @browser
     @nondestructive
     def test_that_more_ways_to_customize_section_is_available(self, mozwebqa):
         """Test for Litmus 15082."""
@@ -80,6 +85,7 @@ class TestDiscoveryPane:
         discovery_pane = DiscoveryPane(mozwebqa, self.basepath)
         Assert.equal(5, discovery_pane.up_and_coming_item_count)
 
+    @browser
     @nondestructive
     def test_the_logout_link_for_logged_in_users(self, mozwebqa):
         """
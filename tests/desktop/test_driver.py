@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import pytest
+
+from unittestzero import Assert
+
+from pages.driver import Driver
+
+#These tests run the driver wrapper against a fake WebDriver.
+#There should be no tests requiring selenium or the network in this class.
+
+
+class FakeElement(object):
+
+    def __init__(self, number):
+        self.number = number
+
+
+class FakeWebDriver(object):
+
+    def __init__(self):
+        self.commands = []
+        self.script_args = []
+        self.mutations = 'page:0'
+        self.found = 0
+
+    def execute(self, driver_command, params=None):
+        self.commands.append(driver_command)
+        if driver_command == 'executeScript':
+            return {'value': self.mutations}
+        return {'value': None}
+
+    def find_element(self, by, value):
+        self.execute('findElement', {'using': by, 'value': value})
+        self.found += 1
+        return FakeElement(self.found)
+
+    def execute_script(self, script, *args):
+        self.script_args.append(list(args))
+        return self.execute('executeScript', {'script': script, 'args': list(args)})['value']
+
+
+@pytest.mark.skip_selenium
+class TestDriver:
+
+    def test_that_a_cached_element_is_only_reused_while_the_document_is_unchanged(self):
+        selenium = FakeWebDriver()
+        driver = Driver(selenium, 10)
+
+        first = driver.find_element('id', 'header')
+        Assert.true(driver.find_element('id', 'header') is first)
+        Assert.equal(1, selenium.found)
+
+        # a change right after the last check is still noticed
+        selenium.mutations = 'page:1'
+        Assert.equal(2, driver.find_element('id', 'header').wrapped_element.number)
+        Assert.equal(2, selenium.found)
+
+    def test_that_cached_elements_inside_script_arguments_are_unwrapped(self):
+        selenium = FakeWebDriver()
+        driver = Driver(selenium, 10)
+        element = driver.find_element('id', 'header')
+
+        driver.execute_script('return arguments;', element, [element], {'root': element})
+        raw = element.wrapped_element
+        Assert.equal([raw, [raw], {'root': raw}], selenium.script_args[0])
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import json
+
+import pytest
+
+from unittestzero import Assert
+
+from pages.duration_history import DurationHistory
+
+#These tests run the duration history against temporary files.
+#There should be no tests requiring selenium or the network in this class.
+
+
+class FakeItem(object):
+
+    def __init__(self, nodeid):
+        self.nodeid = nodeid
+
+
+@pytest.mark.skip_selenium
+class TestDurationHistory:
+
+    def test_that_the_longest_tests_run_first(self):
+        history = DurationHistory('unused', {'a': 1.0, 'b': 5.0, 'c': 3.0, 'd': 1.0})
+        items = [FakeItem(nodeid) for nodeid in ['a', 'b', 'new', 'c', 'd']]
+
+        history.longest_first(items)
+        # new tests count as average, equally long ones keep their order
+        Assert.equal(['b', 'c', 'new', 'a', 'd'], [item.nodeid for item in items])
+        Assert.equal(2.5, history.estimate('new'))
+        Assert.equal(0.0, DurationHistory('unused', {}).estimate('new'))
+
+    def test_that_saving_adds_up_the_phases_and_keeps_older_tests(self, tmpdir):
+        path = str(tmpdir.join('durations.json'))
+        json.dump({'a': 1.0, 'b': 2.0}, open(path, 'w'))
+
+        history = DurationHistory(path)
+        Assert.equal({'a': 1.0, 'b': 2.0}, history.durations)
+        history.add('b', 0.5)
+        history.add('b', 3.0)
+        history.add('c', 0.25)
+        history.save()
+        Assert.equal({'a': 1.0, 'b': 3.5, 'c': 0.25}, DurationHistory(path).durations)
+
+    def test_that_a_session_without_tests_keeps_the_file(self, tmpdir):
+        path = tmpdir.join('durations.json')
+        path.write('not json')
+
+        history = DurationHistory(str(path))
+        Assert.equal({}, history.durations)
+        history.save()
+        Assert.equal('not json', path.read())
+        Assert.equal({}, DurationHistory(str(tmpdir.join('missing.json'))).durations)
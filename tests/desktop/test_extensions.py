@@ -10,10 +10,12 @@ from unittestzero import Assert
 from pages.desktop.home import Home
 
 nondestructive = pytest.mark.nondestructive
+browser = pytest.mark.browser
 
 
 class TestExtensions:
 
+    @browser
     @nondestructive
     def test_featured_tab_is_highlighted_by_default(self, mozwebqa):
         """
@@ -12,6 +12,7 @@ from pages.desktop.home import Home
 
 xfail = pytest.mark.xfail
 nondestructive = pytest.mark.nondestructive
+browser = pytest.mark.browser
 
 
 class HeaderMenu:
@@ -50,6 +51,7 @@ class TestHome:
         HeaderMenu(u'MORE\u2026', [
             "Add-ons for Mobile", "Dictionaries & Language Packs", "Search Tools", "Developer Hub"])]
 
+    @browser
     @nondestructive
     def test_that_checks_the_most_popular_section_exists(self, mozwebqa):
         """
@@ -60,6 +62,7 @@ class TestHome:
         Assert.contains('MOST POPULAR', home_page.most_popular_list_heading)
         Assert.equal(home_page.most_popular_count, 10)
 
+    @browser
     @nondestructive
     def test_that_clicking_on_addon_name_loads_details_page(self, mozwebqa):
         """
@@ -80,6 +83,7 @@ class TestHome:
         Assert.equal(home_page.featured_personas_title, u'Featured Personas See all \xbb', 'Featured Personas region title doesn\'t match')
         Assert.less_equal(home_page.featured_personas_count, 6)
 
+    @browser
     @nondestructive
     def test_that_clicking_see_all_personas_link_works(self, mozwebqa):
         """
@@ -92,6 +96,7 @@ class TestHome:
         Assert.true(featured_persona_page.is_the_current_page)
         Assert.equal(featured_persona_page.persona_header, 'Personas')
 
+    @browser
     @nondestructive
     def test_that_extensions_link_loads_extensions_page(self, mozwebqa):
         """
@@ -134,6 +139,7 @@ class TestHome:
         Assert.equal(home_page.featured_extensions_see_all, u'See all \xbb', 'Featured Extensions region see all link is not correct')
         Assert.equal(home_page.featured_extensions_count, 6)
 
+    @browser
     @nondestructive
     def test_that_clicking_see_all_collections_link_works(self, mozwebqa):
         """
@@ -173,6 +179,7 @@ class TestHome:
         Assert.contains('sort=rating', extensions_page.get_url_current_page())
         Assert.equal('Top Rated', extensions_page.default_selected_tab)
 
+    @browser
     @nondestructive
     def test_that_clicking_most_popular_shows_addons_sorted_by_users(self, mozwebqa):
         """
@@ -185,6 +192,7 @@ class TestHome:
         Assert.contains('sort=users', extensions_page.get_url_current_page())
         Assert.equal('Most Users', extensions_page.default_selected_tab)
 
+    @browser
     @nondestructive
     def test_that_clicking_featured_shows_addons_sorted_by_featured(self, mozwebqa):
         """
@@ -197,6 +205,7 @@ class TestHome:
         Assert.contains('sort=featured', extensions_page.get_url_current_page())
         Assert.equal('Featured', extensions_page.default_selected_tab)
 
+    @browser
     @nondestructive
     @pytest.mark.litmus(25744)
     def test_header_site_navigation_menus_are_correct(self, mozwebqa):
@@ -222,6 +231,7 @@ class TestHome:
 
             Assert.equal(expected_menu_items, actual_menu_items)
 
+    @browser
     @nondestructive
     @pytest.mark.litmus([25747, 25751, 25756, 25760, 25764])
     def test_top_three_items_in_each_site_navigation_menu_are_featured(self, mozwebqa):
@@ -11,6 +11,7 @@ from unittestzero import Assert
 from pages.desktop.home import Home
 
 nondestructive = pytest.mark.nondestructive
+browser = pytest.mark.browser
 
 
 class TestAmoLayout:
@@ -42,6 +43,7 @@ class TestAmoLayout:
         Assert.equal(home_page.amo_logo_title, "Return to the Firefox Add-ons homepage")
         Assert.contains("-cdn.allizom.org/media/img/app-icons/med/firefox.png", home_page.amo_logo_image_source)
 
+    @browser
     @nondestructive
     def test_that_clicking_the_amo_logo_loads_home_page(self, mozwebqa):
         """
@@ -56,6 +58,7 @@ class TestAmoLayout:
         Assert.true(home_page.is_amo_logo_visible)
         Assert.equal(home_page.get_url_current_page(), '%s/en-US/firefox/' % home_page.base_url)
 
+    @browser
     @nondestructive
     def test_that_clicking_mozilla_logo_loads_mozilla_dot_org(self, mozwebqa):
         """
@@ -94,6 +97,7 @@ class TestAmoLayout:
         for app in expected_apps:
             Assert.true(home_page.header.is_other_application_visible(app), "%s link not found in Other Applications menu" % app)
 
+    @browser
     @nondestructive
     def test_the_search_field_placeholder_and_serch_button(self, mozwebqa):
         """
@@ -106,6 +110,7 @@ class TestAmoLayout:
         Assert.true(home_page.header.is_search_button_visible)
         Assert.equal(home_page.header.search_button_title, 'Search')
 
+    @browser
     @nondestructive
     def test_the_search_box_exist(self, mozwebqa):
         """
@@ -15,10 +15,12 @@ from pages.desktop.personas import Personas
 
 xfail = pytest.mark.xfail
 nondestructive = pytest.mark.nondestructive
+browser = pytest.mark.browser
 
 
 class TestPersonas:
 
+    @browser
     @xfail(reason="disabled until Selenium issue http://code.google.com/p/selenium/issues/detail?id=3182 is fixed")
     @nondestructive
     def test_start_exploring_link_in_the_promo_box(self, mozwebqa):
@@ -35,6 +37,7 @@ class TestPersonas:
         Assert.equal("up-and-coming", browse_personas_page.sort_key)
         Assert.equal("Up & Coming", browse_personas_page.sort_by)
 
+    @browser
     @nondestructive
     def test_page_title_for_personas_landing_page(self, mozwebqa):
         """
@@ -45,6 +48,7 @@ class TestPersonas:
         personas_page = home_page.header.site_navigation_menu("Personas").click()
         Assert.true(personas_page.is_the_current_page)
 
+    @browser
     @nondestructive
     def test_the_featured_personas_section(self, mozwebqa):
         """
@@ -56,6 +60,7 @@ class TestPersonas:
         Assert.true(personas_page.is_the_current_page)
         Assert.less_equal(personas_page.featured_personas_count, 6)
 
+    @browser
     @nondestructive
     def test_the_recently_added_section(self, mozwebqa):
         """
@@ -69,6 +74,7 @@ class TestPersonas:
         recently_added_dates = personas_page.recently_added_dates
         Assert.is_sorted_descending(recently_added_dates)
 
+    @browser
     @nondestructive
     def test_the_most_popular_section(self, mozwebqa):
         """
@@ -82,6 +88,7 @@ class TestPersonas:
         downloads = personas_page.most_popular_downloads
         Assert.is_sorted_descending(downloads)
 
+    @browser
     @nondestructive
     def test_the_top_rated_section(self, mozwebqa):
         """
@@ -95,6 +102,7 @@ class TestPersonas:
         ratings = personas_page.top_rated_ratings
         Assert.is_sorted_descending(ratings)
 
+    @browser
     @nondestructive
     def test_breadcrumb_menu_in_persona_details_page(self, mozwebqa):
         """
@@ -143,10 +151,12 @@ class TestPersonas:
         personas_page = Personas(mozwebqa)
         rainbow_personas_detail_page = personas_page.open_persona_detail_page("rainbow-firefox")
         Assert.equal("rainbow firefox", rainbow_personas_detail_page.title)
-        Assert.equal("Add-ons for Firefox", rainbow_personas_detail_page.breadcrumbs[0].text)
-        Assert.equal("Personas", rainbow_personas_detail_page.breadcrumbs[1].text)
-        Assert.equal("rainbow firefox", rainbow_personas_detail_page.breadcrumbs[2].text)
+        with rainbow_personas_detail_page.snapshot():
+            Assert.equal("Add-ons for Firefox", rainbow_personas_detail_page.breadcrumbs[0].text)
+            Assert.equal("Personas", rainbow_personas_detail_page.breadcrumbs[1].text)
+            Assert.equal("rainbow firefox", rainbow_personas_detail_page.breadcrumbs[2].text)
 
+    @browser
     @nondestructive
     def test_personas_breadcrumb_format(self, mozwebqa):
         """
@@ -156,5 +166,6 @@ class TestPersonas:
         home_page = Home(mozwebqa)
 
         personas_page = home_page.header.site_navigation_menu("Personas").click()
-        Assert.equal(personas_page.breadcrumbs[0].text, 'Add-ons for Firefox')
-        Assert.equal(personas_page.breadcrumbs[1].text, 'Personas')
+        with personas_page.snapshot():
+            Assert.equal(personas_page.breadcrumbs[0].text, 'Add-ons for Firefox')
+            Assert.equal(personas_page.breadcrumbs[1].text, 'Personas')
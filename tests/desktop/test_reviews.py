@@ -15,10 +15,12 @@ from pages.desktop.details import Details
 xfail = pytest.mark.xfail
 nondestructive = pytest.mark.nondestructive
 destructive = pytest.mark.destructive
+browser = pytest.mark.browser
 
 
 class TestReviews:
 
+    @browser
     @nondestructive
     def test_that_all_reviews_hyperlink_works(self, mozwebqa):
         """
@@ -56,6 +58,21 @@ class TestReviews:
         Assert.equal(details_page.review_count, 20)
         Assert.equal(details_page.paginator.page_number, page_number + 1)
 
+    @nondestructive
+    def test_that_reviews_of_all_pages_can_be_read(self, mozwebqa):
+        details_page = Details(mozwebqa, 'Adblock Plus')
+        Assert.true(details_page.has_reviews)
+
+        # read the first three pages, 20 reviews each
+        reviews = []
+        for review in details_page.iter_all_reviews():
+            Assert.true(1 <= review.rating <= 5)
+            Assert.not_none(review.author)
+            reviews.append(review)
+            if len(reviews) == 60:
+                break
+        Assert.equal(len(reviews), 60)
+
     @pytest.mark.native
     @xfail(reason="bug 708970")
     @destructive
@@ -13,10 +13,12 @@ from pages.desktop.home import Home
 
 xfail = pytest.mark.xfail
 nondestructive = pytest.mark.nondestructive
+browser = pytest.mark.browser
 
 
 class TestSearch:
 
+    @browser
     @nondestructive
     def test_that_search_all_add_ons_results_have_pagination_that_moves_through_results(self, mozwebqa):
         """
@@ -55,6 +57,7 @@ class TestSearch:
             Assert.equal(first_expected, first_count)
             Assert.equal(second_expected, second_count)
 
+    @browser
     @nondestructive
     def test_that_entering_a_long_string_returns_no_results(self, mozwebqa):
         """
@@ -69,6 +72,7 @@ class TestSearch:
 
         Assert.true('0 matching results' in search_page.number_of_results_text)
 
+    @browser
     @nondestructive
     def test_that_searching_with_unicode_characters_returns_results(self, mozwebqa):
         """
@@ -82,6 +86,7 @@ class TestSearch:
         Assert.contains(search_str, search_page.search_results_title)
         Assert.false('0 matching results' in search_page.number_of_results_text)
 
+    @browser
     @nondestructive
     def test_that_searching_with_substrings_returns_results(self, mozwebqa):
         """
@@ -98,6 +103,7 @@ class TestSearch:
 
         Assert.true(int(results_text_summary.split()[0]) > 1)
 
+    @browser
     @nondestructive
     def test_that_blank_search_returns_results(self, mozwebqa):
         """
@@ -110,6 +116,7 @@ class TestSearch:
         Assert.false(search_page.is_no_results_present)
         Assert.greater(search_page.result_count, 0)
 
+    @browser
     @nondestructive
     def test_that_page_with_search_results_has_correct_title(self, mozwebqa):
         """
@@ -123,6 +130,7 @@ class TestSearch:
         expected_title = '%s :: Search :: Add-ons for Firefox' % search_keyword
         Assert.equal(expected_title, search_page.page_title)
 
+    @browser
     @nondestructive
     def test_that_searching_for_fire_returns_firebug(self, mozwebqa):
         """
@@ -134,6 +142,7 @@ class TestSearch:
 
         Assert.equal(search_page.result(0).name, 'Firebug')
 
+    @browser
     @nondestructive
     def test_that_searching_for_cool_returns_results_with_cool_in_their_name_description(self, mozwebqa):
         """
@@ -158,6 +167,7 @@ class TestSearch:
                 Assert.contains(search_term, search_range.lower())
                 details_page.return_to_previous_page()
 
+    @browser
     @nondestructive
     def test_that_searching_with_numerals_returns_results(self, mozwebqa):
         """
@@ -228,6 +238,7 @@ class TestSearch:
         Assert.true('sort=users' in search_page.get_url_current_page())
         Assert.is_sorted_descending([i.users for i in search_page.results])
 
+    @browser
     @nondestructive
     def test_that_searching_for_a_tag_returns_results(self, mozwebqa):
         """
@@ -243,6 +254,7 @@ class TestSearch:
         search_page.filter.tag('development').click_tag()
         Assert.greater_equal(result_count, search_page.filter.results_count)
 
+    @browser
     @nondestructive
     @xfail(reason="Bugzilla 722647")
     def test_that_search_results_return_20_results_per_page(self, mozwebqa):
@@ -277,6 +289,7 @@ class TestSearch:
         else:
             Assert.equal(search_page.result_count, number)
 
+    @browser
     @nondestructive
     def test_searching_for_collections_returns_results(self, mozwebqa):
         """
@@ -289,6 +302,7 @@ class TestSearch:
 
         Assert.true(amo_search_results_page.result_count > 0)
 
+    @browser
     @nondestructive
     def test_searching_for_personas_returns_results(self, mozwebqa):
         """
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import os
+
+import pytest
+
+from selenium.webdriver.common.by import By
+from unittestzero import Assert
+
+from pages.page import Page
+
+nondestructive = pytest.mark.nondestructive
+browser = pytest.mark.browser
+
+FIXTURE_URL = 'file://%s' % os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'snapshot.html')
+
+# (locator, attributes) read from every matching element
+READS = [
+    ((By.ID, 'summary'), ['class']),
+    ((By.CSS_SELECTOR, '#breadcrumbs li'), []),
+    ((By.CSS_SELECTOR, '#breadcrumbs a'), ['href']),
+    ((By.XPATH, "//ul[@class='authors']//a"), ['href', 'title', 'class']),
+    ((By.LINK_TEXT, 'Jan Odvarko'), ['href']),
+    ((By.PARTIAL_LINK_TEXT, 'Hewitt'), ['title']),
+    ((By.CLASS_NAME, 'note'), []),
+    ((By.NAME, 'q'), ['value', 'placeholder', 'type']),
+    ((By.TAG_NAME, 'form'), ['action']),
+    ((By.ID, 'agree'), ['checked'])]
+
+
+def _read(selenium):
+    return [[(element.tag_name, element.text) + tuple(element.get_attribute(name) for name in attributes)
+             for element in selenium.find_elements(*locator)]
+            for locator, attributes in READS]
+
+
+class TestSnapshot:
+
+    @browser
+    @nondestructive
+    def test_that_snapshot_reads_match_live_reads(self, mozwebqa):
+        page = Page(mozwebqa)
+        page.selenium.get(FIXTURE_URL)
+
+        live = _read(page.selenium)
+        with page.snapshot():
+            copy = _read(page.selenium)
+        Assert.equal(live, copy)
+
+    @browser
+    @nondestructive
+    def test_that_snapshot_elements_act_on_the_live_element(self, mozwebqa):
+        page = Page(mozwebqa)
+        page.selenium.get(FIXTURE_URL)
+
+        with page.snapshot():
+            toggle = page.selenium.find_element(By.ID, 'toggle')
+            status = page.selenium.find_element(By.ID, 'status')
+            hidden = page.selenium.find_element(By.CSS_SELECTOR, '#summary span')
+        Assert.true(toggle.is_displayed())
+        Assert.false(hidden.is_displayed())
+
+        toggle.click()
+        # the copy keeps the text it was taken with, the page moved on
+        Assert.equal('not clicked', status.text)
+        Assert.equal('clicked', page.selenium.find_element(By.ID, 'status').text)
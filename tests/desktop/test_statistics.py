@@ -10,9 +10,11 @@ from pages.desktop.details import Details
 
 
 nondestructive = pytest.mark.nondestructive
+browser = pytest.mark.browser
 
 class TestStatistics:
 
+    @browser
     @nondestructive
     def test_that_verifies_the_url_of_the_statistics_page(self, mozwebqa):
         """ Test for Litmus 25710
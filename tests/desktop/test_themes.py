@@ -12,6 +12,7 @@ from pages.desktop.home import Home
 
 xfail = pytest.mark.xfail
 nondestructive = pytest.mark.nondestructive
+browser = pytest.mark.browser
 
 
 class TestThemes:
@@ -85,6 +86,7 @@ class TestThemes:
         downloads.extend(themes_page.addon_download_number)
         Assert.is_sorted_descending(downloads)
 
+    @browser
     @nondestructive
     def test_that_themes_loads_themes_landing_page(self, mozwebqa):
         """Test for Litmus 15339."""
@@ -93,6 +95,7 @@ class TestThemes:
         url_current_page = themes_page.get_url_current_page()
         Assert.true(url_current_page.endswith("/themes/"))
 
+    @browser
     @nondestructive
     def test_that_clicking_on_theme_name_loads_its_detail_page(self, mozwebqa):
         """Test for Litmus 15363."""
@@ -102,6 +105,7 @@ class TestThemes:
         theme_page = themes_page.click_on_first_addon()
         Assert.contains(theme_name, theme_page.addon_title)
 
+    @browser
     @nondestructive
     def test_that_themes_page_has_correct_title(self, mozwebqa):
         """Test for Litmus 15340."""
@@ -110,6 +114,7 @@ class TestThemes:
         expected_title = "Most Popular Themes :: Add-ons for Firefox"
         Assert.equal(expected_title, themes_page.page_title)
 
+    @browser
     @nondestructive
     def test_themes_page_breadcrumb(self, mozwebqa):
         """Test for Litmus 15344."""
@@ -118,6 +123,7 @@ class TestThemes:
         expected_breadcrumb = "Themes"
         Assert.equal(expected_breadcrumb, themes_page.breadcrumbs[1].text)
 
+    @browser
     @nondestructive
     def test_that_clicking_on_a_subcategory_loads_expected_page(self, mozwebqa):
         """Test for Litmus 15949."""
@@ -127,6 +133,7 @@ class TestThemes:
         amo_category_page = themes_page.click_on_first_category()
         Assert.equal(selected_category, amo_category_page.title)
 
+    @browser
     @nondestructive
     def test_themes_subcategory_page_breadcrumb(self, mozwebqa):
         home_page = Home(mozwebqa)
@@ -135,8 +142,10 @@ class TestThemes:
         amo_category_page = themes_page.click_on_first_category()
         expected_breadcrumbs = ['Add-ons for Firefox', 'Themes', selected_category]
 
-        [Assert.equal(expected_breadcrumbs[i], amo_category_page.breadcrumbs[i].text) for i in range(len(amo_category_page.breadcrumbs))]
+        with amo_category_page.snapshot():
+            [Assert.equal(expected_breadcrumbs[i], amo_category_page.breadcrumbs[i].text) for i in range(len(amo_category_page.breadcrumbs))]
 
+    @browser
     @nondestructive
     def test_that_themes_categories_are_listed_on_left_hand_side(self, mozwebqa):
         """Test for Litmus 15342."""
@@ -152,6 +161,7 @@ class TestThemes:
             current_category = themes_page.get_category(count)
             Assert.equal(category, current_category)
 
+    @browser
     @nondestructive
     def test_that_themes_categories_are_not_extensions_categories(self, mozwebqa):
         """Test for Litmus 15343."""
@@ -165,6 +175,7 @@ class TestThemes:
         Assert.not_equal(len(themes_categories), len(extensions_categories))
         Assert.equal(list(set(themes_categories) & set(extensions_categories)), [])
 
+    @browser
     @nondestructive
     def test_that_last_themes_page_is_not_empty(self, mozwebqa):
         """
@@ -176,6 +187,7 @@ class TestThemes:
         themes_page.paginator.click_last_page()
         Assert.greater_equal(themes_page.addon_count, 1)
 
+    @browser
     @nondestructive
     def test_that_check_the_flag_for_featured_addons(self, mozwebqa):
         """
@@ -16,10 +16,12 @@ from pages.desktop.details import Details
 xfail = pytest.mark.xfail
 nondestructive = pytest.mark.nondestructive
 destructive = pytest.mark.destructive
+browser = pytest.mark.browser
 
 
 class TestAccounts:
 
+    @browser
     @nondestructive
     def test_user_can_login_and_logout(self, mozwebqa):
         """
@@ -36,6 +38,7 @@ class TestAccounts:
         home_page.header.click_logout()
         Assert.false(home_page.header.is_user_logged_in)
 
+    @browser
     @nondestructive
     def test_user_can_login_and_logout_using_browser_id(self, mozwebqa):
         """
@@ -0,0 +1,289 @@
+#!/usr/bin/env python
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+'''
+A stand-in for the AMO search API serving synthetic catalogs.
+
+The server answers /<locale>/firefox/api/1.5/search/<term>[/<type>/<limit>]
+with the addons of a generated catalog whose name or slug contains the
+term, in the same format as addons.mozilla.org. With a limit, ?page=<n>
+selects the page of results. Catalog size, latency and bandwidth can be
+changed between requests, so the API page objects can be load tested
+without a network.
+'''
+
+import BaseHTTPServer
+import cgi
+import gzip
+import hashlib
+import random
+import re
+import SocketServer
+import threading
+import time
+import urllib
+
+from StringIO import StringIO
+from xml.sax.saxutils import escape, quoteattr
+
+WORDS = ['fire', 'tab', 'bug', 'privacy', 'download', 'video', 'theme', 'search',
+         'social', 'mail', 'dev', 'music', 'photo', 'news', 'weather', 'password']
+
+APPLICATIONS = [('Firefox', '1', '3.6', '13.0a1'), ('SeaMonkey', '59', '2.1', '2.10a1'),
+                ('Thunderbird', '18', '3.1', '13.0a1')]
+
+# what the server answers for paths other than a search
+NOT_FOUND_PAGE = '<html><head><title>Not Found</title></head><body><h1>Page not found</h1></body></html>'
+
+
+def synthetic_catalog(size, seed=0):
+    """
+    Returns a list of `size` addon dictionaries with realistic fields. The
+    same size and seed always give the same catalog. The first addon is
+    Firebug, so the default AddOnsAPI search finds it.
+    """
+    rng = random.Random(seed)
+    addons = []
+    for number in range(size):
+        if number == 0:
+            name, slug = 'Firebug', 'firebug'
+        else:
+            word = rng.choice(WORDS)
+            name = '%s Addon %05d' % (word.capitalize(), number)
+            slug = '%s-addon-%05d' % (word, number)
+        application = rng.choice(APPLICATIONS)
+        addons.append({
+            'id': number + 1,
+            'name': name,
+            'slug': slug,
+            'version': '%d.%d.%d' % (rng.randint(0, 5), rng.randint(0, 20), rng.randint(0, 9)),
+            'status': rng.choice([('4', 'Fully Reviewed'), ('1', 'Preliminarily Reviewed')]),
+            'authors': ['Author %d' % rng.randint(1, 5000) for i in range(rng.randint(1, 3))],
+            'summary': '%s makes your browser %s.' % (name, rng.choice(WORDS)),
+            'description': 'Everything about %s, see <a href="http://example.com/%s">the website</a>.' % (name, slug),
+            'previews': rng.randint(0, 5),
+            'rating': str(rng.randint(0, 5)),
+            'application': application,
+            'developer_comments': rng.choice(['Thanks for using %s.' % name, 'Report <b>bugs</b> on the forum.\n']),
+            'reviews': rng.randint(0, 5000),
+            'total_downloads': rng.randint(0, 50000000),
+            'daily_users': rng.randint(0, 2000000),
+        })
+    return addons
+
+
+def render_addon(addon):
+    """Returns the <addon> element of one catalog entry as a string."""
+    slug = addon['slug']
+    url = 'https://addons.example.com/en-US/firefox/addon/%s' % slug
+    parts = [
+        '<addon id="%d">' % addon['id'],
+        '<name>%s</name>' % escape(addon['name']),
+        '<type id="1">Extension</type>',
+        '<guid>%s@example.com</guid>' % slug,
+        '<slug>%s</slug>' % slug,
+        '<version>%s</version>' % addon['version'],
+        '<status id="%s">%s</status>' % addon['status'],
+        '<authors>']
+    for number, author in enumerate(addon['authors']):
+        parts.append('<author id="%d" href="https://addons.example.com/en-US/firefox/user/%d/">'
+                     '<name>%s</name><link>https://addons.example.com/en-US/firefox/user/%d/</link>'
+                     '</author>' % (number, number, escape(author), number))
+    parts.extend([
+        '</authors>',
+        '<summary>%s</summary>' % escape(addon['summary']),
+        '<description>%s</description>' % escape(addon['description']),
+        '<icon size="32">https://static.example.com/img/uploads/addon_icons/%d-32.png</icon>' % addon['id'],
+        '<compatible_applications><application><name>%s</name><application_id>%s</application_id>'
+        '<min_version>%s</min_version><max_version>%s</max_version></application>'
+        '</compatible_applications>' % addon['application'],
+        '<all_compatible_os><os>ALL</os></all_compatible_os>',
+        '<eula></eula>',
+        '<previews>'])
+    for number in range(addon['previews']):
+        image = 'https://static.example.com/img/uploads/previews/%%s/%d/%d.png?src=api&modified=1' % (addon['id'], number)
+        parts.append('<preview primary="%d"><full type="image/png">%s</full>'
+                     '<thumbnail type="image/png">\n        %s\n      </thumbnail>'
+                     '<caption>Screenshot %d</caption></preview>'
+                     % (int(number == 0), escape(image % 'full'), escape(image % 'thumbs'), number))
+    parts.extend([
+        '</previews>',
+        '<rating>%s</rating>' % addon['rating'],
+        '<learnmore>%s?src=api</learnmore>' % url,
+        '<install hash="sha256:%s" os="ALL" size="%d">https://addons.example.com/firefox/downloads/latest/%d/addon-%d-latest.xpi?src=api</install>'
+        % (hashlib.sha256(slug).hexdigest(), addon['id'] * 1024, addon['id'], addon['id']),
+        '<contribution_data></contribution_data>',
+        '<developer_comments>%s</developer_comments>' % escape(addon['developer_comments']),
+        '<reviews num="%d">%s/reviews/?src=api</reviews>' % (addon['reviews'], url),
+        '<total_downloads>%d</total_downloads>' % addon['total_downloads'],
+        '<weekly_downloads>%d</weekly_downloads>' % (addon['total_downloads'] / 500),
+        '<daily_users>%d</daily_users>' % addon['daily_users'],
+        '<created epoch="1136073600">2006-01-01T00:00:00Z</created>',
+        '<last_updated epoch="1325376000">2012-01-01T00:00:00Z</last_updated>',
+        '<homepage>http://example.com/%s</homepage>' % slug,
+        '<support>http://example.com/%s/support</support>' % slug,
+        '<featured>0</featured>',
+        '</addon>'])
+    return ''.join(parts)
+
+
+def render_search_document(addons, total_results=None):
+    """Returns a complete search API response for the given addons."""
+    if total_results is None:
+        total_results = len(addons)
+    return ''.join(['<?xml version="1.0" encoding="utf-8" ?>\n',
+                    '<searchresults total_results=%s>' % quoteattr(str(total_results))] +
+                   [render_addon(addon) for addon in addons] +
+                   ['</searchresults>'])
+
+
+class FakeAMOAPIServer(object):
+    """
+    Serves synthetic search results on a local port from a background thread.
+
+    Change catalog_size, latency (seconds before each response) and bandwidth
+    (bytes per second, None for unlimited) between requests to shape the
+    traffic. Every request path is appended to `requests`.
+    """
+
+    _search_path = re.compile(r'^/[\w-]+/firefox/api/1\.5/search/([^/?]*)(?:/[^/?]*/(\d+))?[^?]*(?:\?(.*))?$')
+
+    def __init__(self, catalog_size=100, latency=0, bandwidth=None, seed=0):
+        self.catalog_size = catalog_size
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.seed = seed
+        self.requests = []
+        self._catalogs = {}
+        self._documents = {}
+        self._lock = threading.Lock()
+        self._server = _ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._server.fake = self
+        self._thread = None
+
+    @property
+    def url(self):
+        """The value to use as api_base_url."""
+        return 'http://%s:%d' % self._server.server_address
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset(self, catalog_size=100, latency=0, bandwidth=None):
+        self.catalog_size = catalog_size
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.requests = []
+
+    def catalog(self):
+        size = self.catalog_size
+        self._lock.acquire()
+        try:
+            if size not in self._catalogs:
+                self._catalogs[size] = synthetic_catalog(size, self.seed)
+            return self._catalogs[size]
+        finally:
+            self._lock.release()
+
+    def search(self, term, limit=None, page=1):
+        """
+        Returns the response body for a search, rendered once per catalog size,
+        term and page. With a limit the results are split into pages of that
+        many addons.
+        """
+        term = term.lower()
+        key = (self.catalog_size, term, limit, page)
+        self._lock.acquire()
+        try:
+            document = self._documents.get(key)
+        finally:
+            self._lock.release()
+        if document is None:
+            addons = [addon for addon in self.catalog()
+                      if term in addon['name'].lower() or term in addon['slug']]
+            total = len(addons)
+            if limit:
+                addons = addons[(page - 1) * limit:page * limit]
+            document = render_search_document(addons, total)
+            self._lock.acquire()
+            try:
+                # only keep the most recent documents, big catalogs are large
+                if len(self._documents) > 8:
+                    self._documents.clear()
+                self._documents[key] = document
+            finally:
+                self._lock.release()
+        return document
+
+
+class _ThreadingHTTPServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+    chunk_size = 16 * 1024
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        fake = self.server.fake
+        fake.requests.append(self.path)
+        if fake.latency:
+            time.sleep(fake.latency)
+
+        match = fake._search_path.match(self.path)
+        if match is None:
+            body = NOT_FOUND_PAGE
+            self.send_response(404)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        term, limit, query = match.groups()
+        page = cgi.parse_qs(query or '').get('page', ['1'])[0]
+        body = fake.search(urllib.unquote(term), limit and int(limit), int(page))
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        gzipped = 'gzip' in (self.headers.get('Accept-Encoding') or '')
+        if gzipped:
+            compressed = StringIO()
+            gzip_file = gzip.GzipFile(fileobj=compressed, mode='wb')
+            gzip_file.write(body)
+            gzip_file.close()
+            body = compressed.getvalue()
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/xml; charset=utf-8')
+        self.send_header('ETag', etag)
+        if gzipped:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+
+        for start in range(0, len(body), self.chunk_size):
+            chunk = body[start:start + self.chunk_size]
+            self.wfile.write(chunk)
+            if fake.bandwidth:
+                time.sleep(float(len(chunk)) / fake.bandwidth)
@@ -11,6 +11,7 @@ from pages.mobile.home import Home
 
 class TestHome:
 
+    @pytest.mark.browser
     @pytest.mark.nondestructive
     def test_that_checks_the_desktop_version_link(self, mozwebqa):
         home = Home(mozwebqa)
@@ -21,6 +22,7 @@ class TestHome:
         home_desktop = home.footer.click_desktop_version()
         Assert.true(home_desktop.is_the_current_page)
 
+    @pytest.mark.browser
     @pytest.mark.nondestructive
     def test_that_checks_the_header_menu(self, mozwebqa):
         home = Home(mozwebqa)
@@ -37,6 +39,7 @@ class TestHome:
         Assert.equal("Add-ons are applications that let you personalize Firefox with extra functionality and style. Whether you mistype the name of a website or can't read a busy page, there's an add-on to improve your on-the-go browsing.",
                      home.learn_more_msg_text)
 
+    @pytest.mark.browser
     @pytest.mark.nondestructive
     def test_that_checks_the_footer_items(self, mozwebqa):
         home = Home(mozwebqa)
@@ -47,6 +50,7 @@ class TestHome:
         Assert.equal('Privacy Policy', home.footer.privacy_text)
         Assert.equal('Legal Notices', home.footer.legal_text)
 
+    @pytest.mark.browser
     @pytest.mark.nondestructive
     def test_that_checks_the_search_box_and_button(self, mozwebqa):
         """